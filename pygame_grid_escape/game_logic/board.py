@@ -1,7 +1,90 @@
 """
 Board class for Grid Escape game.
 """
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+
+# Cells are stored on a padded grid: the playing area is surrounded by a
+# one-cell ring of sentinel cells that are always marked occupied, so a
+# neighbor of any on-board cell always has an index and never needs a
+# bounds check. Intersection (x, y) lives at index (x + 1) * stride + (y + 1).
+
+
+def _build_cell_positions(grid_size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Build the (x, y) coordinates of every cell on the padded grid.
+    
+    Args:
+        grid_size: Number of intersections along each side of the board
+        
+    Returns:
+        Tuple indexed by padded cell index holding (x, y) tuples; ring
+        cells get coordinates of -1 or grid_size
+    """
+    stride = grid_size + 2
+    return tuple((index // stride - 1, index % stride - 1) for index in range(stride * stride))
+
+
+def _build_ring_mask(grid_size: int) -> int:
+    """
+    Build the occupancy-bit mask of the sentinel ring around the board.
+    
+    Args:
+        grid_size: Number of intersections along each side of the board
+        
+    Returns:
+        Bitmask with the bit of every padded cell outside the playing area set
+    """
+    mask = 0
+    for index, (x, y) in enumerate(_build_cell_positions(grid_size)):
+        if not (0 <= x < grid_size and 0 <= y < grid_size):
+            mask |= 1 << index
+    return mask
+
+
+def _build_cell_masks(positions_by_player: Dict[int, Tuple[Tuple[int, int], ...]],
+                      grid_size: int) -> Dict[int, int]:
+    """
+    Build the occupancy-bit mask of each player's set of intersections.
+    
+    Args:
+        positions_by_player: (x, y) intersections keyed by player ID
+        grid_size: Number of intersections along each side of the board
+        
+    Returns:
+        Dictionary of bitmasks keyed by player ID, with the bit of each
+        position's padded cell set
+    """
+    stride = grid_size + 2
+    masks = {}
+    for player_id, positions in positions_by_player.items():
+        mask = 0
+        for x, y in positions:
+            mask |= 1 << ((x + 1) * stride + y + 1)
+        masks[player_id] = mask
+    return masks
+
+
+def _build_adjacency(grid_size: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Build the in-bounds orthogonal neighbors of every cell.
+    
+    Args:
+        grid_size: Number of intersections along each side of the board
+        
+    Returns:
+        Tuple indexed by padded cell index holding neighbor (x, y) tuples
+        in up, down, left, right order; ring cells have no neighbors
+    """
+    adjacency = []
+    for x, y in _build_cell_positions(grid_size):
+        neighbors = []
+        if 0 <= x < grid_size and 0 <= y < grid_size:
+            for new_x, new_y in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if 0 <= new_x < grid_size and 0 <= new_y < grid_size:
+                    neighbors.append((new_x, new_y))
+        adjacency.append(tuple(neighbors))
+    return tuple(adjacency)
 
 
 class Board:
@@ -16,25 +99,74 @@ class Board:
     # Board dimensions
     GRID_SIZE = 7
     
+    # Padded cell layout; the board geometry never changes so the tables are built once
+    # Intersection (x, y) is cell (x + 1) * CELL_STRIDE + (y + 1)
+    CELL_STRIDE = GRID_SIZE + 2
+    CELL_POSITIONS = _build_cell_positions(GRID_SIZE)
+    _RING_MASK = _build_ring_mask(GRID_SIZE)
+    _ADJACENT = _build_adjacency(GRID_SIZE)
+    _EMPTY_INTERSECTIONS = (None,) * (CELL_STRIDE * CELL_STRIDE)
+    
+    # Cell index offset of one forward step, keyed by player ID
+    # Player 1 moves up (y - 1) and Player 2 moves left (x - 1)
+    FORWARD_STEPS = {1: -1, 2: -CELL_STRIDE}
+    
+    # Starting and escape positions keyed by player ID, fixed by the game rules
+    # Player 1 (ID 1) starts on the bottom row (y = 6) and escapes from the top row (y = 0)
+    # Player 2 (ID 2) starts on the right column (x = 6) and escapes from the left column (x = 0)
+    # Only the center 5 points (1-5) of each edge are used
+    _STARTING_POSITIONS = {
+        1: tuple((x, 6) for x in range(1, 6)),
+        2: tuple((6, y) for y in range(1, 6)),
+    }
+    _ESCAPE_POSITIONS = {
+        1: tuple((x, 0) for x in range(1, 6)),
+        2: tuple((0, y) for y in range(1, 6)),
+    }
+    
+    # Callers pass coordinates, and hashing an (x, y) tuple into these sets
+    # is cheaper than bounds-checking it and testing a cell mask bit
+    _STARTING_SETS = {player_id: frozenset(positions)
+                      for player_id, positions in _STARTING_POSITIONS.items()}
+    _ESCAPE_SETS = {player_id: frozenset(positions)
+                    for player_id, positions in _ESCAPE_POSITIONS.items()}
+    _ESCAPE_MASKS = _build_cell_masks(_ESCAPE_POSITIONS, GRID_SIZE)
+    
     def __init__(self):
         """Initialize a new 5x5 game board."""
         # Grid coordinates range from (0,0) to (4,4)
         # (0,0) is top-left, (4,4) is bottom-right
         self._grid_size = self.GRID_SIZE
         
-        # Track which intersections are occupied by pawns
-        # Key: (x, y) tuple, Value: Pawn object or None
-        self._intersections = {}
+        # Track which intersections are occupied by pawns in a flat list
+        # indexed by padded cell index, so lookups need no tuple hashing
+        # Value: Pawn object or None
+        self._intersections = list(self._EMPTY_INTERSECTIONS)
         
-        # Initialize all intersections as empty
-        for x in range(self._grid_size):
-            for y in range(self._grid_size):
-                self._intersections[(x, y)] = None
+        # Occupancy bitboard: bit (padded cell index) is set when occupied
+        # The sentinel ring is always set so it never reads as empty
+        self._occupied = self._RING_MASK
+        
+        # Per-player occupancy bitboards
+        # Key: player ID, Value: bitmask of cells holding that player's pawns
+        self._player_masks = {}
+        
+        # Bumped on every change to occupancy so callers can cache
+        # results derived from the board state
+        self._version = 0
     
-    def is_valid_position(self, x: int, y: int) -> bool:
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever a pawn is placed, moved, or removed."""
+        return self._version
+    
+    @classmethod
+    def is_valid_position(cls, x: int, y: int) -> bool:
         """
         Check if the given coordinates represent a valid position on the board.
         
+        The board size is fixed, so this can also be called on the class.
+        
         Args:
             x: X-coordinate
             y: Y-coordinate
@@ -42,7 +174,11 @@ class Board:
         Returns:
             True if the position is valid (within board bounds), False otherwise
         """
-        return 0 <= x < self._grid_size and 0 <= y < self._grid_size
+        # Chained comparisons against the size beat range membership and a
+        # bitboard test alike: a cell index for coordinates off the board can
+        # alias a cell on it, so a bitboard would still need the bounds check
+        size = cls.GRID_SIZE
+        return 0 <= x < size and 0 <= y < size
     
     def is_intersection_empty(self, x: int, y: int) -> bool:
         """
@@ -57,7 +193,22 @@ class Board:
         """
         if not self.is_valid_position(x, y):
             return False
-        return self._intersections[(x, y)] is None
+        return self._empty_unchecked(x, y)
+    
+    def _empty_unchecked(self, x: int, y: int) -> bool:
+        """
+        Check if an intersection is empty without validating the coordinates.
+        
+        Callers must have already checked the position with is_valid_position.
+        
+        Args:
+            x: X-coordinate
+            y: Y-coordinate
+            
+        Returns:
+            True if the intersection is empty, False if occupied
+        """
+        return not (self._occupied >> ((x + 1) * self.CELL_STRIDE + y + 1)) & 1
     
     def get_pawn_at_intersection(self, x: int, y: int) -> Optional[object]:
         """
@@ -72,7 +223,7 @@ class Board:
         """
         if not self.is_valid_position(x, y):
             return None
-        return self._intersections[(x, y)]
+        return self._intersections[(x + 1) * self.CELL_STRIDE + y + 1]
     
     def place_pawn(self, pawn, x: int, y: int) -> bool:
         """
@@ -86,10 +237,16 @@ class Board:
         Returns:
             True if the pawn was placed successfully, False otherwise
         """
-        if not self.is_valid_position(x, y) or not self.is_intersection_empty(x, y):
+        if not self.is_valid_position(x, y) or not self._empty_unchecked(x, y):
             return False
         
-        self._intersections[(x, y)] = pawn
+        index = (x + 1) * self.CELL_STRIDE + y + 1
+        bit = 1 << index
+        player_id = pawn.player.player_id
+        self._intersections[index] = pawn
+        self._occupied |= bit
+        self._version += 1
+        self._player_masks[player_id] = self._player_masks.get(player_id, 0) | bit
         return True
     
     def remove_pawn(self, x: int, y: int) -> Optional[object]:
@@ -106,8 +263,17 @@ class Board:
         if not self.is_valid_position(x, y):
             return None
         
-        pawn = self._intersections[(x, y)]
-        self._intersections[(x, y)] = None
+        index = (x + 1) * self.CELL_STRIDE + y + 1
+        pawn = self._intersections[index]
+        if pawn is None:
+            return None
+        
+        bit = 1 << index
+        player_id = pawn.player.player_id
+        self._intersections[index] = None
+        self._occupied &= ~bit
+        self._version += 1
+        self._player_masks[player_id] &= ~bit
         return pawn
     
     def move_pawn(self, from_x: int, from_y: int, to_x: int, to_y: int) -> bool:
@@ -123,17 +289,42 @@ class Board:
         Returns:
             True if the move was successful, False otherwise
         """
-        # Check if source position has a pawn and destination is empty
-        if (not self.is_valid_position(from_x, from_y) or 
-            not self.is_valid_position(to_x, to_y) or
-            self._intersections[(from_x, from_y)] is None or
-            not self.is_intersection_empty(to_x, to_y)):
+        # Check bounds once, then that the source has a pawn and the destination is empty
+        if not (self.is_valid_position(from_x, from_y) and self.is_valid_position(to_x, to_y)):
+            return False
+        if self._empty_unchecked(from_x, from_y) or not self._empty_unchecked(to_x, to_y):
+            return False
+        
+        stride = self.CELL_STRIDE
+        return self.move_pawn_between_cells((from_x + 1) * stride + from_y + 1,
+                                            (to_x + 1) * stride + to_y + 1)
+    
+    def move_pawn_between_cells(self, from_cell: int, to_cell: int) -> bool:
+        """
+        Move a pawn between two cells without re-validating the destination.
+        
+        The caller must already know that the destination is an empty
+        intersection on the board, for example from get_forward_move_mask.
+        
+        Args:
+            from_cell: Source cell index (see cell_index)
+            to_cell: Destination cell index (see cell_index)
+            
+        Returns:
+            True if the move was successful, False if the source had no pawn
+        """
+        intersections = self._intersections
+        pawn = intersections[from_cell]
+        if pawn is None:
             return False
         
-        # Move the pawn
-        pawn = self._intersections[(from_x, from_y)]
-        self._intersections[(from_x, from_y)] = None
-        self._intersections[(to_x, to_y)] = pawn
+        intersections[to_cell] = pawn
+        intersections[from_cell] = None
+        
+        move_bits = (1 << from_cell) | (1 << to_cell)
+        self._occupied ^= move_bits
+        self._version += 1
+        self._player_masks[pawn.player.player_id] ^= move_bits
         return True
     
     def is_starting_position(self, x: int, y: int, player) -> bool:
@@ -148,17 +339,7 @@ class Board:
         Returns:
             True if the position is a valid starting position for the player
         """
-        if not self.is_valid_position(x, y):
-            return False
-        
-        # Player 1 (ID 1) starts on the bottom row (y = 6) in the center 5 points (x = 1-5)
-        # Player 2 (ID 2) starts on the right column (x = 6) in the center 5 points (y = 1-5)
-        if player.player_id == 1:
-            return y == 6 and 1 <= x <= 5
-        elif player.player_id == 2:
-            return x == 6 and 1 <= y <= 5
-        else:
-            return False
+        return (x, y) in self._STARTING_SETS.get(player.player_id, ())
     
     def is_escape_position(self, x: int, y: int, player) -> bool:
         """
@@ -172,19 +353,25 @@ class Board:
         Returns:
             True if the position is an escape position for the player
         """
-        if not self.is_valid_position(x, y):
-            return False
+        return (x, y) in self._ESCAPE_SETS.get(player.player_id, ())
+    
+    def is_escape_cell(self, cell: int, player) -> bool:
+        """
+        Check if the given board cell is an escape position for the player.
         
-        # Player 1 (ID 1) escapes from the top row (y = 0) in the center 5 points (x = 1-5)
-        # Player 2 (ID 2) escapes from the left column (x = 0) in the center 5 points (y = 1-5)
-        if player.player_id == 1:
-            return y == 0 and 1 <= x <= 5
-        elif player.player_id == 2:
-            return x == 0 and 1 <= y <= 5
-        else:
-            return False
+        Callers that already hold a cell index (such as a just-validated move
+        destination) can use this instead of converting back to coordinates.
+        
+        Args:
+            cell: Cell index on the board (see cell_index)
+            player: The player to check for
+            
+        Returns:
+            True if the cell is an escape position for the player
+        """
+        return bool((self._ESCAPE_MASKS.get(player.player_id, 0) >> cell) & 1)
     
-    def get_adjacent_intersections(self, x: int, y: int) -> List[Tuple[int, int]]:
+    def get_adjacent_intersections(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
         """
         Get all adjacent intersections to the given position.
         
@@ -196,27 +383,13 @@ class Board:
             y: Y-coordinate
             
         Returns:
-            List of (x, y) tuples representing adjacent intersections
+            Tuple of (x, y) tuples representing adjacent intersections; the
+            tuple is shared and precomputed, so no allocation happens per call
         """
         if not self.is_valid_position(x, y):
-            return []
-        
-        adjacent = []
-        
-        # Check all four directions: up, down, left, right
-        directions = [
-            (0, -1),  # Up
-            (0, 1),   # Down
-            (-1, 0),  # Left
-            (1, 0)    # Right
-        ]
-        
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-            if self.is_valid_position(new_x, new_y):
-                adjacent.append((new_x, new_y))
+            return ()
         
-        return adjacent
+        return self._ADJACENT[(x + 1) * self.CELL_STRIDE + y + 1]
     
     def get_valid_moves_from_position(self, x: int, y: int) -> List[Tuple[int, int]]:
         """
@@ -231,58 +404,167 @@ class Board:
         Returns:
             List of (x, y) tuples representing valid move destinations
         """
-        adjacent_positions = self.get_adjacent_intersections(x, y)
-        valid_moves = []
+        if not self.is_valid_position(x, y):
+            return []
+        
+        # The sentinel ring reads as occupied, so the four neighbors
+        # (up, down, left, right) can be tested without bounds checks
+        stride = self.CELL_STRIDE
+        positions = self.CELL_POSITIONS
+        occupied = self._occupied
+        index = (x + 1) * stride + y + 1
+        return [positions[neighbor]
+                for neighbor in (index - 1, index + 1, index - stride, index + stride)
+                if not (occupied >> neighbor) & 1]
+    
+    @classmethod
+    def cell_index(cls, x: int, y: int) -> int:
+        """
+        Get the cell index of a position on the board.
         
-        for adj_x, adj_y in adjacent_positions:
-            if self.is_intersection_empty(adj_x, adj_y):
-                valid_moves.append((adj_x, adj_y))
+        The cell layout is fixed, so this can also be called on the class.
         
-        return valid_moves
+        Args:
+            x: X-coordinate (must be a valid position)
+            y: Y-coordinate (must be a valid position)
+            
+        Returns:
+            The padded cell index used by the board's bitboards
+        """
+        return (x + 1) * cls.CELL_STRIDE + y + 1
     
-    def get_all_starting_positions(self, player) -> List[Tuple[int, int]]:
+    def get_forward_move_mask(self, cell: int, player) -> int:
         """
-        Get all starting positions for the given player.
+        Get the bitmask of the cells a player's pawn at the given cell can move to.
+        
+        Pawns only move one step forward in their player's direction, so the
+        mask has at most one bit set: the forward cell, if it is empty.
         
         Args:
-            player: The player to get starting positions for
+            cell: Cell index of the pawn (see cell_index)
+            player: The player who owns the pawn
             
         Returns:
-            List of (x, y) tuples representing starting positions
+            Bitmask of valid destination cells
         """
-        starting_positions = []
+        step = self.FORWARD_STEPS.get(player.player_id)
+        if step is None:
+            return 0
         
-        for x in range(self._grid_size):
-            for y in range(self._grid_size):
-                if self.is_starting_position(x, y, player):
-                    starting_positions.append((x, y))
+        # The sentinel ring reads as occupied, so no bounds check is needed
+        target = cell + step
+        return ~self._occupied & (1 << target)
+    
+    def get_movable_pawns_mask(self, player) -> int:
+        """
+        Get the bitmask of the player's pawns that can move forward.
+        
+        Player 1 pawns move up (decreasing y) and Player 2 pawns move left
+        (decreasing x). The empty-cell bitboard is shifted back by one step in
+        the player's direction and intersected with the player's pawns, so all
+        pawns are tested at once without per-pawn iteration.
         
-        return starting_positions
+        Args:
+            player: The player to check for
+            
+        Returns:
+            Bitmask of the cells holding the player's movable pawns
+        """
+        step = self.FORWARD_STEPS.get(player.player_id)
+        if step is None:
+            return 0
+        
+        # The sentinel ring is never empty, so edge pawns need no masking
+        pawns = self._player_masks.get(player.player_id, 0)
+        return pawns & (~self._occupied << -step)
     
-    def get_all_escape_positions(self, player) -> List[Tuple[int, int]]:
+    def player_has_valid_move(self, player) -> bool:
         """
-        Get all escape positions for the given player.
+        Check if any of the player's pawns on the board can move forward.
         
         Args:
-            player: The player to get escape positions for
+            player: The player to check for
             
         Returns:
-            List of (x, y) tuples representing escape positions
+            True if at least one of the player's pawns has an empty cell ahead
         """
-        escape_positions = []
+        return bool(self.get_movable_pawns_mask(player))
+    
+    def count_legal_moves(self, player) -> int:
+        """
+        Count the player's legal moves without building them.
+        
+        Each pawn has at most one forward move, so this is the number of set
+        bits in the movable-pawns mask. Intended for search code that only
+        needs move counts at leaf positions.
+        
+        Args:
+            player: The player to count moves for
+            
+        Returns:
+            Number of legal moves available to the player
+        """
+        return bin(self.get_movable_pawns_mask(player)).count("1")
+    
+    def get_legal_moves(self, player) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Get every legal move for the player in a single pass.
         
-        for x in range(self._grid_size):
-            for y in range(self._grid_size):
-                if self.is_escape_position(x, y, player):
-                    escape_positions.append((x, y))
+        Intended for callers that evaluate whole positions, such as a search
+        over possible moves, where asking each pawn for its moves would be slow.
         
-        return escape_positions
+        Args:
+            player: The player to get moves for
+            
+        Returns:
+            List of ((from_x, from_y), (to_x, to_y)) tuples
+        """
+        mask = self.get_movable_pawns_mask(player)
+        if not mask:
+            return []
+        
+        step = self.FORWARD_STEPS[player.player_id]
+        positions = self.CELL_POSITIONS
+        moves = []
+        while mask:
+            # Peel off the lowest set bit
+            low = mask & -mask
+            cell = low.bit_length() - 1
+            moves.append((positions[cell], positions[cell + step]))
+            mask ^= low
+        return moves
+    
+    def get_all_starting_positions(self, player) -> Tuple[Tuple[int, int], ...]:
+        """
+        Get all starting positions for the given player.
+        
+        Args:
+            player: The player to get starting positions for
+            
+        Returns:
+            Shared tuple of (x, y) tuples representing starting positions
+        """
+        return self._STARTING_POSITIONS.get(player.player_id, ())
+    
+    def get_all_escape_positions(self, player) -> Tuple[Tuple[int, int], ...]:
+        """
+        Get all escape positions for the given player.
+        
+        Args:
+            player: The player to get escape positions for
+            
+        Returns:
+            Shared tuple of (x, y) tuples representing escape positions
+        """
+        return self._ESCAPE_POSITIONS.get(player.player_id, ())
     
     def clear_board(self) -> None:
         """Clear all pawns from the board."""
-        for x in range(self._grid_size):
-            for y in range(self._grid_size):
-                self._intersections[(x, y)] = None
+        # Refill the existing list in one C-level slice assignment
+        self._intersections[:] = self._EMPTY_INTERSECTIONS
+        self._occupied = self._RING_MASK
+        self._player_masks.clear()
+        self._version += 1
     
     def get_grid_size(self) -> int:
         """
@@ -9,7 +9,7 @@ class GameState:
     """
     Manages the overall state of the Grid Escape game.
     
-    This includes tracking the current phase (setup or movement),
+    This includes tracking the current phase (playing or game over),
     the current player's turn, victory conditions, and automatic
     turn management when players cannot move.
     """
@@ -29,6 +29,14 @@ class GameState:
         # Create the game board
         self.board = Board()
         
+        # Set whenever something visible changes; the main loop only
+        # redraws while it is set and clears it after drawing
+        self.dirty = True
+        
+        # Bumped by every move, escape, turn switch and reset, so drawing
+        # code can tell with one comparison that nothing it shows changed
+        self.state_token = 0
+        
         # Set initial game state
         self.phase = self.PLAYING
         self.current_player_index = 0
@@ -39,6 +47,20 @@ class GameState:
         self.turn_skipped = False
         self.skipped_player_id = None
         self.stalemate = False
+        
+        # Whether the last successful move ended on one of the mover's exit points
+        self.moved_to_exit = False
+    
+    @property
+    def selected_pawn(self):
+        """Get the pawn selected by the current player, or None."""
+        return self._selected_pawn
+    
+    @selected_pawn.setter
+    def selected_pawn(self, pawn) -> None:
+        """Select a pawn, or clear the selection with None."""
+        self._selected_pawn = pawn
+        self.dirty = True
     
     def get_current_player(self) -> Player:
         """
@@ -56,8 +78,18 @@ class GameState:
         Returns:
             The other player
         """
-        other_index = (self.current_player_index + 1) % len(self.players)
-        return self.players[other_index]
+        return self.players[self._next_index()]
+    
+    def _next_index(self) -> int:
+        """
+        Get the index of the player who takes the next turn.
+        
+        There are always exactly two players, so this is a single XOR.
+        
+        Returns:
+            The index of the other player in the players list
+        """
+        return self.current_player_index ^ 1
     
     def switch_turn(self) -> Tuple[bool, Optional[int]]:
         """
@@ -74,6 +106,9 @@ class GameState:
         if self.phase == self.GAME_OVER:
             return False, None
         
+        self.dirty = True
+        self.state_token += 1
+        
         # Reset turn skipped flags
         self.turn_skipped = False
         self.skipped_player_id = None
@@ -88,48 +123,39 @@ class GameState:
             self.phase = self.GAME_OVER
             return False, None
         
-        # Switch to next player
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        # Switch to next player (there are exactly two)
+        index = self.current_player_index ^ 1
+        self.current_player_index = index
         
-        # If in playing phase, check if current player can move
-        if self.phase == self.PLAYING:
-            # Check both players to avoid infinite recursion
-            players_checked = 0
-            
-            # Keep track of which players we've checked
-            checked_players = set()
-            
-            while players_checked < len(self.players):
-                current_player = self.get_current_player()
-                current_id = current_player.player_id
-                
-                # If we've already checked this player, we're in a stalemate
-                if current_id in checked_players:
-                    self.stalemate = True
-                    self.phase = self.GAME_OVER
-                    return False, None
-                
-                checked_players.add(current_id)
-                
-                # Check if current player can move
-                if self.can_player_move(current_player):
-                    # Current player can move, stop here
-                    break
-                
-                # Current player cannot move, mark turn as skipped
-                self.turn_skipped = True
-                self.skipped_player_id = current_player.player_id
-                
-                # Try next player
-                self.current_player_index = (self.current_player_index + 1) % len(self.players)
-                players_checked += 1
-            
-            # If we've checked all players and none can move, game should end in stalemate
-            if players_checked >= len(self.players):
-                self.stalemate = True
-                self.phase = self.GAME_OVER
-                return False, None
+        # Common case: the next player has a move, so nothing is skipped
+        if self.can_player_move(self.players[index]):
+            return False, None
         
+        return self._skip_blocked_turn()
+    
+    def _skip_blocked_turn(self) -> Tuple[bool, Optional[int]]:
+        """
+        Handle a turn switch where the new current player cannot move.
+        
+        With two players at most one more check is needed: the turn passes
+        back to the other player, and if that player is blocked too the
+        game ends in a stalemate.
+        
+        Returns:
+            Tuple containing:
+            - Boolean indicating if a turn was skipped
+            - Player ID of the skipped player (or None if no skip)
+        """
+        current_player = self.get_current_player()
+        self.turn_skipped = True
+        self.skipped_player_id = current_player.player_id
+        
+        if not self.can_player_move(self.get_other_player()):
+            self.stalemate = True
+            self.phase = self.GAME_OVER
+            return False, None
+        
+        self.current_player_index ^= 1
         return self.turn_skipped, self.skipped_player_id
     
     def is_setup_phase(self) -> bool:
@@ -157,6 +183,10 @@ class GameState:
         """
         Check if the game is over.
         
+        The turn logic switches the phase to GAME_OVER as soon as a player
+        wins or both are blocked, so this is a single comparison and never
+        scans the board.
+        
         Returns:
             True if the game is over, False otherwise
         """
@@ -171,9 +201,13 @@ class GameState:
         Returns:
             The winning player, or None if no player has won yet
         """
-        for player in self.players:
-            if player.has_won():
-                return player
+        # Escape counts are kept up to date by each Player, so this is
+        # two constant-time reads rather than a scan over every pawn
+        player1, player2 = self.players
+        if player1.has_won():
+            return player1
+        if player2.has_won():
+            return player2
         return None
     
     def can_player_move(self, player: Player) -> bool:
@@ -186,48 +220,7 @@ class GameState:
         Returns:
             True if the player can make at least one valid move, False otherwise
         """
-        return player.can_move_any_pawn(self.board)
-    
-    def transition_to_playing_phase(self) -> bool:
-        """
-        Transition from setup phase to playing phase.
-        
-        This should be called when all pawns have been placed during setup.
-        
-        Returns:
-            True if transition was successful, False if not in setup phase
-        """
-        if self.phase != self.SETUP:
-            return False
-        
-        # Check if all pawns have been placed
-        total_unplaced = sum(len(player.get_unplaced_pawns()) for player in self.players)
-        if total_unplaced == 0:
-            self.phase = self.PLAYING
-            self.current_player_index = 0  # Player 1 starts the movement phase
-            
-            # Reset turn management flags
-            self.turn_skipped = False
-            self.skipped_player_id = None
-            self.stalemate = False
-            
-            return True
-        
-        return False
-    
-    def is_setup_complete(self) -> bool:
-        """
-        Check if the setup phase is complete.
-        
-        Setup is complete when all pawns from both players have been placed.
-        
-        Returns:
-            True if setup is complete, False otherwise
-        """
-        for player in self.players:
-            if len(player.get_unplaced_pawns()) > 0:
-                return False
-        return True
+        return self.board.player_has_valid_move(player)
     
     def get_winner(self) -> Optional[Player]:
         """
@@ -250,12 +243,10 @@ class GameState:
         
         # Reset all pawns for both players
         for player in self.players:
-            # Reset pawns
-            for pawn in player.get_pawns():
-                pawn._position = None
-                pawn._escaped = False
+            player.reset_pawns()
         
         # Reset game state
+        self.state_token += 1
         self.phase = self.PLAYING
         self.current_player_index = 0
         self.selected_pawn = None
@@ -265,6 +256,7 @@ class GameState:
         self.turn_skipped = False
         self.skipped_player_id = None
         self.stalemate = False
+        self.moved_to_exit = False
     
     def place_pawn(self, pawn, x: int, y: int) -> bool:
         """
@@ -279,20 +271,23 @@ class GameState:
             True if pawn was placed successfully, False otherwise
         """
         # Check if the pawn belongs to the current player
-        current_player = self.get_current_player()
-        if pawn.player != current_player:
+        player = pawn.player
+        if player is not self.players[self.current_player_index]:
             return False
         
         # Check if position is valid starting position for the pawn's player
-        if not self.board.is_starting_position(x, y, pawn.player):
+        board = self.board
+        if not board.is_starting_position(x, y, player):
             return False
         
         # Try to place the pawn on the board
-        if self.board.place_pawn(pawn, x, y):
+        if board.place_pawn(pawn, x, y):
             pawn.set_position(x, y)
+            self.dirty = True
+            self.state_token += 1
             
             # Switch to next player after placing a pawn
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+            self.current_player_index ^= 1
             
             # Check for victory
             winner = self.check_victory()
@@ -320,26 +315,31 @@ class GameState:
             return False
         
         # Check if it's the pawn's owner's turn
-        if pawn.player != self.get_current_player():
+        player = pawn.player
+        if player is not self.players[self.current_player_index]:
             return False
         
-        current_pos = pawn.get_position()
-        if not current_pos:
+        board = self.board
+        from_cell = pawn.get_cell()
+        if from_cell is None or not board.is_valid_position(to_x, to_y):
             return False
         
-        from_x, from_y = current_pos
-        
-        # Get valid moves based on player's direction
-        valid_moves = pawn.get_valid_moves(self.board)
-        if (to_x, to_y) not in valid_moves:
+        # Test the destination bit against the pawn's forward-move mask
+        # instead of building and scanning its list of valid moves
+        to_cell = board.cell_index(to_x, to_y)
+        if not (board.get_forward_move_mask(from_cell, player) >> to_cell) & 1:
             return False
         
         # Execute the move
-        if self.board.move_pawn(from_x, from_y, to_x, to_y):
-            pawn.set_position(to_x, to_y)
+        if self._apply_move(pawn, from_cell, to_cell):
+            # Record whether the pawn reached an exit point while the
+            # destination cell is at hand, so callers need not look it up
+            self.moved_to_exit = board.is_escape_cell(to_cell, player)
+            self.dirty = True
+            self.state_token += 1
             
             # Switch turns after successful move
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
+            self.current_player_index ^= 1
             
             # Check for victory
             winner = self.check_victory()
@@ -351,6 +351,25 @@ class GameState:
         
         return False
         
+    def _apply_move(self, pawn, from_cell: int, to_cell: int) -> bool:
+        """
+        Move a pawn on the board and update its position in one step.
+        
+        The destination must already have been checked as a legal move.
+        
+        Args:
+            pawn: The pawn to move
+            from_cell: Board cell index the pawn is on
+            to_cell: Board cell index to move the pawn to
+            
+        Returns:
+            True if the pawn was moved, False if it was not on the board
+        """
+        if not self.board.move_pawn_between_cells(from_cell, to_cell):
+            return False
+        pawn.set_cell(to_cell)
+        return True
+    
     def escape_pawn(self, pawn) -> bool:
         """
         Remove a pawn from the board when it's at an escape position.
@@ -365,7 +384,8 @@ class GameState:
             return False
             
         # Check if it's the pawn's owner's turn
-        if pawn.player != self.get_current_player():
+        player = pawn.player
+        if player is not self.players[self.current_player_index]:
             return False
             
         # Check if the pawn is on the board
@@ -376,15 +396,18 @@ class GameState:
         x, y = current_pos
         
         # Check if the pawn is at an escape position
-        if not self.board.is_escape_position(x, y, pawn.player):
+        board = self.board
+        if not board.is_escape_position(x, y, player):
             return False
             
         # Remove the pawn from the board and mark it as escaped
-        self.board.remove_pawn(x, y)
+        board.remove_pawn(x, y)
         pawn.escape()
+        self.dirty = True
+        self.state_token += 1
         
         # Switch turns after successful escape
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.current_player_index ^= 1
         
         # Check for victory
         winner = self.check_victory()
@@ -1,7 +1,9 @@
 """
 Pawn class for Grid Escape game.
 """
-from typing import Optional, Tuple, List, Set
+from typing import Optional, Tuple, List, Sequence, Set
+from .board import Board
+
 
 class Pawn:
     """
@@ -11,6 +13,13 @@ class Pawn:
     moved between intersections, and eventually escaped from the board.
     """
     
+    # No __slots__: callers and tests replace methods such as get_valid_moves
+    # on individual pawns, which needs a per-instance __dict__
+    
+    # Pawn state values other than a board cell index (which is never negative)
+    _UNPLACED = -1
+    _ESCAPED = -2
+    
     def __init__(self, player, pawn_id: int):
         """
         Initialize a new pawn.
@@ -21,8 +30,15 @@ class Pawn:
         """
         self._player = player
         self._pawn_id = pawn_id
-        self._position: Optional[Tuple[int, int]] = None
-        self._escaped = False
+        # Board cell index (see Board.cell_index) while on the board,
+        # otherwise _UNPLACED or _ESCAPED, so every state test is one compare
+        self._state = self._UNPLACED
+        
+        # Last get_valid_moves result and the board state it was computed for
+        self._moves_board = None
+        self._moves_version = -1
+        self._moves_cell = None
+        self._moves: List[Tuple[int, int]] = []
     
     @property
     def player(self):
@@ -41,7 +57,20 @@ class Pawn:
         Returns:
             A tuple (x, y) representing the grid coordinates, or None if not on board
         """
-        return self._position
+        state = self._state
+        if state < 0:
+            return None
+        return Board.CELL_POSITIONS[state]
+    
+    def get_cell(self) -> Optional[int]:
+        """
+        Get the board cell index of the pawn.
+        
+        Returns:
+            The cell index (see Board.cell_index), or None if not on board
+        """
+        state = self._state
+        return state if state >= 0 else None
     
     def set_position(self, x: int, y: int) -> None:
         """
@@ -51,8 +80,21 @@ class Pawn:
             x: X-coordinate (0-4)
             y: Y-coordinate (0-4)
         """
-        self._position = (x, y)
-        self._escaped = False
+        self.set_cell(Board.cell_index(x, y))
+    
+    def set_cell(self, cell: int) -> None:
+        """
+        Set the position of the pawn by board cell index.
+        
+        Args:
+            cell: Cell index on the board (see Board.cell_index)
+        """
+        previous_state = self._state
+        self._state = cell
+        if previous_state == self._ESCAPED:
+            self._player._on_pawn_returned(self)
+        self._player._on_pawn_moved(
+            self, previous_state if previous_state >= 0 else None, cell)
     
     def is_on_board(self) -> bool:
         """
@@ -61,7 +103,7 @@ class Pawn:
         Returns:
             True if the pawn is on the board, False otherwise
         """
-        return self._position is not None and not self._escaped
+        return self._state >= 0
     
     def escape(self) -> None:
         """
@@ -69,8 +111,14 @@ class Pawn:
         
         This removes the pawn from the board and marks it as escaped.
         """
-        self._escaped = True
-        self._position = None
+        # The player's hook still needs the cell the pawn is leaving
+        if self._state != self._ESCAPED:
+            self._player._on_pawn_escaped(self)
+        self._state = self._ESCAPED
+    
+    def reset(self) -> None:
+        """Return the pawn to its initial unplaced, non-escaped state."""
+        self._state = self._UNPLACED
     
     def is_escaped(self) -> bool:
         """
@@ -79,7 +127,7 @@ class Pawn:
         Returns:
             True if the pawn has escaped, False otherwise
         """
-        return self._escaped
+        return self._state == self._ESCAPED
     
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """
@@ -89,33 +137,61 @@ class Pawn:
         For Player 1, only upward movement is allowed (bottom to top).
         For Player 2, only leftward movement is allowed (right to left).
         
+        The moves are the set bits of get_valid_moves_mask, expanded to
+        coordinates for callers that need them. The result is cached until
+        the board or the pawn's position changes, so callers must not modify
+        the returned list.
+        
         Args:
             board: The game board
             
         Returns:
             List of (x, y) coordinates representing valid move destinations
         """
-        if not self.is_on_board() or self._position is None:
+        if not self.is_on_board():
             return []
         
-        x, y = self._position
+        # Reuse the previous result while neither the board nor the pawn changed
+        version = board.version
+        cell = self._state
+        if (board is self._moves_board and version == self._moves_version
+                and cell == self._moves_cell):
+            return self._moves
         
-        # Get all adjacent empty positions
-        adjacent_empty = board.get_valid_moves_from_position(x, y)
-        valid_moves = []
+        # Expand the valid moves mask, so the list and the mask always agree;
+        # each set bit is the cell index of one destination
+        positions = Board.CELL_POSITIONS
+        mask = self.get_valid_moves_mask(board)
+        moves = []
+        while mask:
+            lowest = mask & -mask
+            moves.append(positions[lowest.bit_length() - 1])
+            mask ^= lowest
         
-        # Filter based on player's allowed direction
-        for adj_x, adj_y in adjacent_empty:
-            # Player 1 can only move upward (decreasing y)
-            if self._player.player_id == 1 and adj_y < y:
-                valid_moves.append((adj_x, adj_y))
-            # Player 2 can only move leftward (decreasing x)
-            elif self._player.player_id == 2 and adj_x < x:
-                valid_moves.append((adj_x, adj_y))
+        self._moves_board = board
+        self._moves_version = version
+        self._moves_cell = cell
+        self._moves = moves
+        return moves
+    
+    def get_valid_moves_mask(self, board) -> int:
+        """
+        Get the valid moves for this pawn as a bitmask of board cells.
+        
+        Bits are numbered by board cell index (see Board.cell_index), so a
+        destination can be tested with a single shift and mask.
         
-        return valid_moves
+        Args:
+            board: The game board
+            
+        Returns:
+            Bitmask of valid destination cells, 0 if the pawn cannot move
+        """
+        if not self.is_on_board():
+            return 0
+        return board.get_forward_move_mask(self._state, self._player)
     
-    def get_adjacent_positions(self, board) -> List[Tuple[int, int]]:
+    def get_adjacent_positions(self, board) -> Sequence[Tuple[int, int]]:
         """
         Get all adjacent positions regardless of whether they are occupied.
         
@@ -125,12 +201,12 @@ class Pawn:
             board: The game board
             
         Returns:
-            List of (x, y) coordinates representing adjacent positions
+            Sequence of (x, y) coordinates representing adjacent positions
         """
-        if not self.is_on_board() or self._position is None:
+        if not self.is_on_board():
             return []
         
-        x, y = self._position
+        x, y = self.get_position()
         return board.get_adjacent_intersections(x, y)
     
     def is_blocked(self, board) -> bool:
@@ -164,12 +240,12 @@ class Pawn:
         Returns:
             True if the move is valid, False otherwise
         """
-        if not self.is_on_board() or self._position is None:
+        if not self.is_on_board() or not board.is_valid_position(to_x, to_y):
             return False
         
-        # Check if destination is in valid moves list
-        valid_moves = self.get_valid_moves(board)
-        return (to_x, to_y) in valid_moves
+        # Check the destination's bit in the valid moves mask
+        to_cell = board.cell_index(to_x, to_y)
+        return bool((self.get_valid_moves_mask(board) >> to_cell) & 1)
     
     def is_adjacent_to(self, x: int, y: int) -> bool:
         """
@@ -184,17 +260,14 @@ class Pawn:
         Returns:
             True if the position is adjacent, False otherwise
         """
-        if not self.is_on_board() or self._position is None:
+        if not self.is_on_board():
             return False
         
-        current_x, current_y = self._position
-        
-        # Check if horizontally or vertically adjacent (not diagonal)
-        # Adjacent means exactly one coordinate differs by exactly 1
-        x_diff = abs(current_x - x)
-        y_diff = abs(current_y - y)
+        current_x, current_y = self.get_position()
         
-        return (x_diff == 1 and y_diff == 0) or (x_diff == 0 and y_diff == 1)
+        # Horizontally or vertically adjacent (not diagonal) means the
+        # Manhattan distance is exactly 1
+        return abs(current_x - x) + abs(current_y - y) == 1
     
     def would_escape_at(self, board, x: int, y: int) -> bool:
         """
@@ -210,7 +283,8 @@ class Pawn:
         """
         return board.is_escape_position(x, y, self._player)
     
-    def move_to(self, board, to_x: int, to_y: int) -> bool:
+    def move_to(self, board, to_x: int, to_y: int,
+                valid_moves: Optional[List[Tuple[int, int]]] = None) -> bool:
         """
         Move this pawn to the specified position if the move is valid.
         
@@ -224,15 +298,21 @@ class Pawn:
             board: The game board
             to_x: Destination X-coordinate
             to_y: Destination Y-coordinate
+            valid_moves: This pawn's valid moves if the caller already has
+                them, so they are not computed again
             
         Returns:
             True if the move was successful, False otherwise
         """
-        # Validate the move
-        if not self.can_move_to(board, to_x, to_y):
+        # Validate the move against a single valid-moves lookup
+        if not self.is_on_board():
+            return False
+        if valid_moves is None:
+            valid_moves = self.get_valid_moves(board)
+        if (to_x, to_y) not in valid_moves:
             return False
         
-        current_x, current_y = self._position
+        current_x, current_y = Board.CELL_POSITIONS[self._state]
         
         # Execute the move on the board
         if board.move_pawn(current_x, current_y, to_x, to_y):
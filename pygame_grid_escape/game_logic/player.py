@@ -1,8 +1,9 @@
 """
 Player class for Grid Escape game.
 """
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 from .pawn import Pawn
+from .board import Board
 
 class Player:
     """
@@ -12,6 +13,10 @@ class Player:
     including which pawns are on the board and which have escaped.
     """
     
+    # Fixed attribute set: smaller instances and faster attribute access
+    __slots__ = ('_player_id', '_color', '_pawns', '_unplaced_pawns',
+                 '_pawns_on_board', '_escaped_pawns', '_pawns_by_cell')
+    
     def __init__(self, player_id: int, color: Tuple[int, int, int]):
         """
         Initialize a new player.
@@ -22,7 +27,19 @@ class Player:
         """
         self._player_id = player_id
         self._color = color
-        self._pawns = [Pawn(self, i) for i in range(7)]  # Each player has 7 pawns
+        # Each player has 7 pawns; the set never changes, so it is a tuple
+        # that get_pawns can hand out without copying
+        self._pawns = tuple(Pawn(self, i) for i in range(7))
+        
+        # Unplaced, on-board and escaped pawns, maintained incrementally by
+        # the pawns themselves so the getters below do not scan every pawn
+        self._unplaced_pawns = list(self._pawns)
+        self._pawns_on_board = []
+        self._escaped_pawns = []
+        
+        # Pawns on the board keyed by board cell index (see Board.cell_index),
+        # maintained by the pawns so position lookups need no scan
+        self._pawns_by_cell = {}
         
     @property
     def player_id(self) -> int:
@@ -34,42 +51,55 @@ class Player:
         """Get the player's color."""
         return self._color
     
-    def get_pawns(self) -> List[Pawn]:
+    @property
+    def escaped_pawn_count(self) -> int:
+        """Get how many of the player's pawns have escaped."""
+        return len(self._escaped_pawns)
+    
+    def get_pawns(self) -> Sequence[Pawn]:
         """
         Get all pawns belonging to this player.
         
         Returns:
-            List of all pawns owned by this player
+            Tuple of all pawns owned by this player, in pawn ID order
         """
         return self._pawns
     
-    def get_pawns_on_board(self) -> List[Pawn]:
+    def get_pawns_on_board(self) -> Sequence[Pawn]:
         """
         Get all pawns that are currently on the board.
         
+        The list is kept up to date as pawns move, so callers must not
+        modify it.
+        
         Returns:
             List of pawns that are on the board
         """
-        return [pawn for pawn in self._pawns if pawn.is_on_board()]
+        return self._pawns_on_board
     
-    def get_escaped_pawns(self) -> List[Pawn]:
+    def get_escaped_pawns(self) -> Sequence[Pawn]:
         """
         Get all pawns that have escaped from the board.
         
+        The list is kept up to date as pawns escape, so callers must not
+        modify it.
+        
         Returns:
             List of pawns that have escaped
         """
-        return [pawn for pawn in self._pawns if pawn.is_escaped()]
+        return self._escaped_pawns
     
-    def get_unplaced_pawns(self) -> List[Pawn]:
+    def get_unplaced_pawns(self) -> Sequence[Pawn]:
         """
         Get all pawns that have not yet been placed on the board.
         
+        The list is kept up to date as pawns are placed, so callers must not
+        modify it.
+        
         Returns:
-            List of pawns that have not been placed
+            List of pawns that have not been placed, in pawn ID order
         """
-        return [pawn for pawn in self._pawns 
-                if not pawn.is_on_board() and not pawn.is_escaped()]
+        return self._unplaced_pawns
     
     def has_won(self) -> bool:
         """
@@ -80,7 +110,77 @@ class Player:
         Returns:
             True if the player has won, False otherwise
         """
-        return len(self.get_escaped_pawns()) == 7
+        # The escaped list is maintained by the pawn hooks, so its length
+        # is already a constant-time counter
+        return len(self._escaped_pawns) == 7
+    
+    def reset_pawns(self) -> None:
+        """Return all of this player's pawns to their initial unplaced state."""
+        for pawn in self._pawns:
+            pawn.reset()
+        self._unplaced_pawns = list(self._pawns)
+        self._pawns_on_board = []
+        self._escaped_pawns = []
+        self._pawns_by_cell = {}
+    
+    def _on_pawn_escaped(self, pawn: Pawn) -> None:
+        """
+        Record that one of this player's pawns has escaped.
+        
+        Args:
+            pawn: The pawn that escaped
+        """
+        self._escaped_pawns.append(pawn)
+        self._leave_list(self._pawns_on_board, pawn)
+        self._leave_list(self._unplaced_pawns, pawn)
+        self._forget_cell(pawn, pawn.get_cell())
+    
+    def _on_pawn_returned(self, pawn: Pawn) -> None:
+        """
+        Record that a previously escaped pawn was put back on the board.
+        
+        Args:
+            pawn: The pawn that is no longer escaped
+        """
+        self._leave_list(self._escaped_pawns, pawn)
+    
+    def _on_pawn_moved(self, pawn: Pawn, from_cell, to_cell: int) -> None:
+        """
+        Record that one of this player's pawns was placed or moved.
+        
+        Args:
+            pawn: The pawn that moved
+            from_cell: Cell index the pawn left, or None if it was not on the board
+            to_cell: Cell index the pawn is now on
+        """
+        if from_cell is None:
+            self._leave_list(self._unplaced_pawns, pawn)
+            self._pawns_on_board.append(pawn)
+        self._forget_cell(pawn, from_cell)
+        self._pawns_by_cell[to_cell] = pawn
+    
+    @staticmethod
+    def _leave_list(pawns: List[Pawn], pawn: Pawn) -> None:
+        """
+        Remove a pawn from one of the state lists if it is in it.
+        
+        Args:
+            pawns: The list to remove the pawn from
+            pawn: The pawn to remove
+        """
+        if pawn in pawns:
+            pawns.remove(pawn)
+    
+    def _forget_cell(self, pawn: Pawn, cell) -> None:
+        """
+        Drop a pawn's entry from the position lookup if it is still there.
+        
+        Args:
+            pawn: The pawn leaving the cell
+            cell: Cell index the pawn is leaving, or None
+        """
+        if cell is not None and self._pawns_by_cell.get(cell) is pawn:
+            del self._pawns_by_cell[cell]
     
     def can_move_any_pawn(self, board) -> bool:
         """
@@ -92,12 +192,14 @@ class Player:
         Returns:
             True if at least one pawn can move, False otherwise
         """
-        for pawn in self.get_pawns_on_board():
+        # Stops at the first movable pawn; each pawn's moves are cached
+        # until the board changes, so repeated checks in a turn are cheap
+        for pawn in self._pawns_on_board:
             if pawn.get_valid_moves(board):
                 return True
         return False
     
-    def get_pawn_at_position(self, x: int, y: int) -> Pawn:
+    def get_pawn_at_position(self, x: int, y: int) -> Optional[Pawn]:
         """
         Get the pawn at the specified position, if any.
         
@@ -108,8 +210,8 @@ class Player:
         Returns:
             The pawn at the position, or None if no pawn is there
         """
-        for pawn in self.get_pawns_on_board():
-            pos = pawn.get_position()
-            if pos and pos[0] == x and pos[1] == y:
-                return pawn
-        return None
\ No newline at end of file
+        # One hash lookup in the cell index the pawns keep up to date; off-board
+        # coordinates could alias an on-board cell index, so they are rejected first
+        if not Board.is_valid_position(x, y):
+            return None
+        return self._pawns_by_cell.get(Board.cell_index(x, y))
\ No newline at end of file
@@ -5,7 +5,50 @@ This module processes user input and translates it into game actions,
 handling mouse clicks for pawn selection and movement.
 """
 import pygame
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+
+class _PlayerMessages(dict):
+    """
+    Message strings keyed by player ID, formatted once per ID on first use.
+    
+    There are only two players, so each message is built a single time and
+    every later click reuses the same string instead of formatting it again.
+    """
+    
+    def __init__(self, template: str):
+        """
+        Initialize the message table.
+        
+        Args:
+            template: Message with a {} placeholder for the player ID
+        """
+        super().__init__()
+        self._template = template
+    
+    def __missing__(self, player_id) -> str:
+        """
+        Format, store and return the message for a player ID not seen yet.
+        
+        Args:
+            player_id: The player ID to format the message for
+            
+        Returns:
+            The formatted message
+        """
+        message = self[player_id] = self._template.format(player_id)
+        return message
+
+
+# Per-player messages shown by the click handlers
+_TURN_MESSAGES = _PlayerMessages("Player {}'s turn")
+_PLACED_MESSAGES = _PlayerMessages("Pawn placed. Player {}'s turn")
+_SKIPPED_MESSAGES = _PlayerMessages("Player {}'s turn skipped - no valid moves!")
+_SELECTED_MESSAGES = _PlayerMessages("Selected Player {}'s pawn")
+_OPPONENT_PAWN_MESSAGES = _PlayerMessages("That's Player {}'s pawn")
+_SETUP_ROW_ERRORS = _PlayerMessages("Invalid position - must be on Player {}'s starting row")
+_STARTING_ROW_ERRORS = _PlayerMessages("Invalid position - Player {} must place pawns on their starting row")
+
 
 class InputHandler:
     """
@@ -16,6 +59,12 @@ class InputHandler:
     appropriate game actions based on the current game state.
     """
     
+    # Clickable restart area on the game over screen: half extents around
+    # a point RESTART_OFFSET_Y pixels below the window center
+    RESTART_HALF_WIDTH = 100
+    RESTART_HALF_HEIGHT = 20
+    RESTART_OFFSET_Y = 40  # Where the restart text is
+    
     def __init__(self, renderer=None):
         """
         Initialize the input handler.
@@ -24,6 +73,11 @@ class InputHandler:
             renderer: The game renderer for visual feedback
         """
         self.renderer = renderer
+        
+        # Center of the restart area, computed once per renderer since the
+        # window size never changes
+        self._restart_renderer = None
+        self._restart_center = (0, 0)
     
     def handle_click(self, pos: Tuple[int, int], game_state, renderer) -> bool:
         """
@@ -45,13 +99,10 @@ class InputHandler:
         
         # Handle game over state first
         if game_state.is_game_over():
-            # Check if click is on the restart button area (center of screen)
-            center_x, center_y = renderer.WINDOW_WIDTH // 2, renderer.WINDOW_HEIGHT // 2
-            restart_area_size = 100  # Size of the clickable area
-            
             # Check if click is within the restart button area
-            if (abs(pos[0] - center_x) < restart_area_size and 
-                abs(pos[1] - (center_y + 40)) < 20):  # +40 is where the restart text is
+            center_x, center_y = self._get_restart_center(renderer)
+            if (abs(pos[0] - center_x) < self.RESTART_HALF_WIDTH and
+                    abs(pos[1] - center_y) < self.RESTART_HALF_HEIGHT):
                 game_state.reset_game()
                 renderer.show_notification("Game restarted")
                 return True
@@ -70,6 +121,64 @@ class InputHandler:
         # In the new game flow, we handle both placing and moving in a single phase
         return self._handle_game_click(x, y, game_state)
     
+    def handle_clicks(self, clicks: List[Tuple[int, int]], game_state, renderer) -> int:
+        """
+        Process all mouse clicks collected during one frame, in order.
+        
+        Every click is a game action whose result the next click depends on,
+        so none of them can be dropped.
+        
+        Args:
+            clicks: (x, y) pixel coordinates of each click, oldest first
+            game_state: The current game state
+            renderer: The game renderer
+            
+        Returns:
+            Number of clicks that were processed successfully
+        """
+        handle_click = self.handle_click
+        processed = 0
+        for pos in clicks:
+            if handle_click(pos, game_state, renderer):
+                processed += 1
+        return processed
+    
+    def handle_keys(self, keys: List[int], game_state, renderer) -> None:
+        """
+        Process all key presses collected during one frame.
+        
+        The keys are coalesced: R (restart) clears the selection as well, so
+        one restart covers every R and ESC pressed in the frame, and repeated
+        ESC presses deselect only once.
+        
+        Args:
+            keys: pygame key codes of each key press, oldest first
+            game_state: The current game state
+            renderer: The game renderer
+        """
+        if pygame.K_r in keys:
+            game_state.reset_game()
+            renderer.show_notification("Game restarted")
+        elif pygame.K_ESCAPE in keys and game_state.selected_pawn:
+            game_state.selected_pawn = None
+            renderer.show_notification("Pawn deselected")
+    
+    def _get_restart_center(self, renderer) -> Tuple[int, int]:
+        """
+        Get the pixel center of the restart area for the given renderer.
+        
+        Args:
+            renderer: The game renderer
+            
+        Returns:
+            (x, y) pixel coordinates of the restart area's center
+        """
+        if renderer is not self._restart_renderer:
+            self._restart_center = (renderer.WINDOW_WIDTH // 2,
+                                    renderer.WINDOW_HEIGHT // 2 + self.RESTART_OFFSET_Y)
+            self._restart_renderer = renderer
+        return self._restart_center
+    
     def _handle_setup_phase_click(self, x: int, y: int, game_state) -> bool:
         """
         Handle a click during the setup phase.
@@ -84,25 +193,27 @@ class InputHandler:
         Returns:
             True if a pawn was placed, False otherwise
         """
+        board = game_state.board
+        renderer = self.renderer
         current_player = game_state.get_current_player()
         
         # Check if the position is a valid starting position for the current player
-        if not game_state.board.is_starting_position(x, y, current_player):
+        if not board.is_starting_position(x, y, current_player):
             # Show error message for invalid starting position
-            self.renderer.show_error_message(f"Invalid position - must be on Player {current_player.player_id}'s starting row")
+            renderer.show_error_message(_SETUP_ROW_ERRORS[current_player.player_id])
             return False
         
         # Check if the position is empty
-        if not game_state.board.is_intersection_empty(x, y):
+        if not board.is_intersection_empty(x, y):
             # Show error message for occupied position
-            self.renderer.show_error_message("Position already occupied")
+            renderer.show_error_message("Position already occupied")
             return False
         
         # Get an unplaced pawn
         unplaced_pawns = current_player.get_unplaced_pawns()
         if not unplaced_pawns:
             # Show error message for no pawns left
-            self.renderer.show_error_message("No pawns left to place")
+            renderer.show_error_message("No pawns left to place")
             return False
         
         # Place the pawn
@@ -110,12 +221,13 @@ class InputHandler:
         if game_state.place_pawn(pawn, x, y):
             # Show notification about whose turn it is now
             next_player = game_state.get_current_player()
-            self.renderer.show_notification(f"Player {next_player.player_id}'s turn")
+            messages = [_TURN_MESSAGES[next_player.player_id]]
             
             # Check if we've transitioned to playing phase
             if game_state.is_movement_phase():
-                self.renderer.show_notification("Setup complete! Movement phase begins")
+                messages.append("Setup complete! Movement phase begins")
             
+            self._notify(messages)
             return True
         
         return False
@@ -134,31 +246,36 @@ class InputHandler:
         Returns:
             True if a pawn was selected or moved, False otherwise
         """
+        board = game_state.board
+        renderer = self.renderer
         current_player = game_state.get_current_player()
         
+        # Keep a reference to the selected pawn (in case a move clears it)
+        selected_pawn = game_state.selected_pawn
+        
         # If a pawn is already selected
-        if game_state.selected_pawn:
+        if selected_pawn:
             # Check if the click is on a valid move destination
-            valid_moves = game_state.selected_pawn.get_valid_moves(game_state.board)
+            valid_moves = selected_pawn.get_valid_moves(board)
             if (x, y) in valid_moves:
-                # Store reference to pawn before move (in case it gets cleared)
-                moving_pawn = game_state.selected_pawn
+                moving_pawn = selected_pawn
                 
                 # Move the pawn
                 if game_state.move_pawn(moving_pawn, x, y):
                     # Pawn moved successfully, selection is cleared in move_pawn
                     # Show notification for successful move
-                    self.renderer.show_notification("Pawn moved")
+                    messages = ["Pawn moved"]
                     
                     # Check if the pawn escaped
                     if moving_pawn.is_escaped():
-                        self.renderer.show_notification("Pawn escaped!")
+                        messages.append("Pawn escaped!")
                     
                     # Check if turn was skipped after this move
                     turn_skipped, skipped_player_id = game_state.turn_skipped, game_state.skipped_player_id
                     if turn_skipped and skipped_player_id:
-                        self.renderer.show_notification(f"Player {skipped_player_id}'s turn skipped - no valid moves!")
+                        messages.append(_SKIPPED_MESSAGES[skipped_player_id])
                     
+                    self._notify(messages)
                     return True
             else:
                 # Click was not on a valid move destination
@@ -167,7 +284,7 @@ class InputHandler:
                 if pawn_at_pos:
                     # Select the new pawn
                     game_state.selected_pawn = pawn_at_pos
-                    self.renderer.show_notification(f"Selected Player {current_player.player_id}'s pawn")
+                    renderer.show_notification(_SELECTED_MESSAGES[current_player.player_id])
                     return True
                 else:
                     # Check if there's an opponent's pawn at this position
@@ -176,17 +293,17 @@ class InputHandler:
                     
                     if opponent_pawn:
                         # Show error for clicking on opponent's pawn
-                        self.renderer.show_error_message("Cannot move to occupied position")
-                    elif not game_state.board.is_valid_position(x, y):
+                        renderer.show_error_message("Cannot move to occupied position")
+                    elif not board.is_valid_position(x, y):
                         # Show error for invalid position
-                        self.renderer.show_error_message("Invalid position")
-                    elif (x, y) not in game_state.board.get_adjacent_positions(*game_state.selected_pawn.get_position()):
+                        renderer.show_error_message("Invalid position")
+                    elif not selected_pawn.is_adjacent_to(x, y):
                         # Show error for non-adjacent position
-                        self.renderer.show_error_message("Can only move to adjacent positions")
+                        renderer.show_error_message("Can only move to adjacent positions")
                     else:
                         # Deselect the current pawn
                         game_state.selected_pawn = None
-                        self.renderer.show_notification("Pawn deselected")
+                        renderer.show_notification("Pawn deselected")
                     return True
         else:
             # No pawn is selected, try to select one
@@ -194,7 +311,7 @@ class InputHandler:
             if pawn_at_pos:
                 # Select the pawn
                 game_state.selected_pawn = pawn_at_pos
-                self.renderer.show_notification(f"Selected Player {current_player.player_id}'s pawn")
+                renderer.show_notification(_SELECTED_MESSAGES[current_player.player_id])
                 return True
             else:
                 # Check if there's an opponent's pawn at this position
@@ -203,10 +320,10 @@ class InputHandler:
                 
                 if opponent_pawn:
                     # Show error for clicking on opponent's pawn
-                    self.renderer.show_error_message(f"That's Player {opponent.player_id}'s pawn")
+                    renderer.show_error_message(_OPPONENT_PAWN_MESSAGES[opponent.player_id])
                 else:
                     # Show error for clicking on empty space with no pawn selected
-                    self.renderer.show_error_message("Select your pawn first")
+                    renderer.show_error_message("Select your pawn first")
         
         return False
     
@@ -238,120 +355,147 @@ class InputHandler:
         Returns:
             True if an action was performed, False otherwise
         """
+        # Bind the objects used on every path once
+        board = game_state.board
+        renderer = self.renderer
         current_player = game_state.get_current_player()
+        selected_pawn = game_state.selected_pawn
         
-        # If a pawn is already selected, try to move it or escape it
-        if game_state.selected_pawn:
-            # Get the current position of the selected pawn
-            current_pos = game_state.selected_pawn.get_position()
-            if current_pos:
-                current_x, current_y = current_pos
-                
-                # Check if the pawn is at an escape position and the player clicked on it again
-                if game_state.board.is_escape_position(current_x, current_y, current_player) and x == current_x and y == current_y:
-                    # Try to escape the pawn
-                    if game_state.escape_pawn(game_state.selected_pawn):
-                        # Pawn escaped successfully
-                        game_state.selected_pawn = None
-                        self.renderer.show_notification("Pawn escaped!")
-                        
-                        # Show whose turn it is now
-                        next_player = game_state.get_current_player()
-                        self.renderer.show_notification(f"Player {next_player.player_id}'s turn")
-                        
-                        return True
-                
-                # Check if the click is on a valid move destination
-                valid_moves = game_state.selected_pawn.get_valid_moves(game_state.board)
-                if (x, y) in valid_moves:
-                    # Store reference to pawn before move (in case it gets cleared)
-                    moving_pawn = game_state.selected_pawn
-                    
-                    # Move the pawn
-                    if game_state.move_pawn(moving_pawn, x, y):
-                        # Pawn moved successfully, selection is cleared
-                        game_state.selected_pawn = None
-                        self.renderer.show_notification("Pawn moved")
-                        
-                        # Check if the pawn is at an escape position
-                        if game_state.board.is_escape_position(x, y, current_player):
-                            self.renderer.show_notification("Pawn at exit point! Click again to escape.")
-                        
-                        # Show whose turn it is now
-                        next_player = game_state.get_current_player()
-                        self.renderer.show_notification(f"Player {next_player.player_id}'s turn")
-                        
-                        return True
-                else:
-                    # Click was not on a valid move destination
-                    # Check if it's on another of the player's pawns
-                    pawn_at_pos = current_player.get_pawn_at_position(x, y)
-                    if pawn_at_pos:
-                        # Select the new pawn
-                        game_state.selected_pawn = pawn_at_pos
-                        
-                        # Check if this pawn is at an escape position
-                        pawn_pos = pawn_at_pos.get_position()
-                        if pawn_pos and game_state.board.is_escape_position(pawn_pos[0], pawn_pos[1], current_player):
-                            self.renderer.show_notification(f"Selected pawn at exit point. Click again to escape.")
-                        else:
-                            self.renderer.show_notification(f"Selected Player {current_player.player_id}'s pawn")
-                        
-                        return True
-                    else:
-                        # Deselect the current pawn
-                        game_state.selected_pawn = None
-                        self.renderer.show_notification("Pawn deselected")
-                        return True
+        if selected_pawn:
+            return self._handle_selected_pawn_click(x, y, game_state, board,
+                                                    current_player, selected_pawn)
+        
+        # No pawn is selected: first check if the click is on an existing pawn
+        pawn_at_pos = current_player.get_pawn_at_position(x, y)
+        if pawn_at_pos:
+            self._select_pawn(pawn_at_pos, game_state, board, current_player)
+            return True
+        
+        # Otherwise the click must place a new pawn on the starting row
+        if not board.is_starting_position(x, y, current_player):
+            # Check if there's an opponent's pawn at this position
+            opponent = game_state.get_other_player()
+            if opponent.get_pawn_at_position(x, y):
+                # Show error for clicking on opponent's pawn
+                renderer.show_error_message(_OPPONENT_PAWN_MESSAGES[opponent.player_id])
+            else:
+                # Show error for clicking on invalid position
+                renderer.show_error_message(_STARTING_ROW_ERRORS[current_player.player_id])
+            return False
+        
+        if not board.is_intersection_empty(x, y):
+            renderer.show_error_message("Position already occupied")
+            return False
+        
+        unplaced_pawns = current_player.get_unplaced_pawns()
+        if not unplaced_pawns:
+            renderer.show_error_message("No pawns left to place")
+            return False
+        
+        # Place the first unplaced pawn
+        if not game_state.place_pawn(unplaced_pawns[0], x, y):
+            return False
+        
+        # Show notification about whose turn it is now
+        next_player = game_state.get_current_player()
+        renderer.show_notification(_PLACED_MESSAGES[next_player.player_id])
+        return True
+    
+    def _handle_selected_pawn_click(self, x: int, y: int, game_state, board,
+                                    current_player, selected_pawn) -> bool:
+        """
+        Handle a click while one of the current player's pawns is selected.
+        
+        Clicking the selected pawn again at an exit point escapes it, clicking a
+        valid destination moves it, clicking another own pawn selects that pawn,
+        and any other click deselects.
+        
+        Args:
+            x: Grid X-coordinate
+            y: Grid Y-coordinate
+            game_state: The current game state
+            board: The game board
+            current_player: The player whose turn it is
+            selected_pawn: The currently selected pawn
             
-        else:
-            # No pawn is selected
+        Returns:
+            True if an action was performed, False otherwise
+        """
+        renderer = self.renderer
+        current_pos = selected_pawn.get_position()
+        if not current_pos:
+            return False
+        current_x, current_y = current_pos
+        
+        # Clicking the selected pawn again at an escape position escapes it
+        if (x == current_x and y == current_y
+                and board.is_escape_position(current_x, current_y, current_player)
+                and game_state.escape_pawn(selected_pawn)):
+            game_state.selected_pawn = None
             
-            # First, check if the click is on an existing pawn
-            pawn_at_pos = current_player.get_pawn_at_position(x, y)
-            if pawn_at_pos:
-                # Select the pawn
-                game_state.selected_pawn = pawn_at_pos
-                
-                # Check if this pawn is at an escape position
-                pawn_pos = pawn_at_pos.get_position()
-                if pawn_pos and game_state.board.is_escape_position(pawn_pos[0], pawn_pos[1], current_player):
-                    self.renderer.show_notification(f"Selected pawn at exit point. Click again to escape.")
-                else:
-                    self.renderer.show_notification(f"Selected Player {current_player.player_id}'s pawn")
-                
-                return True
+            # Show whose turn it is now
+            next_player = game_state.get_current_player()
+            self._notify(["Pawn escaped!", _TURN_MESSAGES[next_player.player_id]])
+            return True
+        
+        # Check if the click is on a valid move destination
+        if (x, y) in selected_pawn.get_valid_moves(board):
+            if not game_state.move_pawn(selected_pawn, x, y):
+                return False
             
-            # Check if the position is a valid starting position for the current player
-            if game_state.board.is_starting_position(x, y, current_player):
-                # Check if the position is empty
-                if game_state.board.is_intersection_empty(x, y):
-                    # Get an unplaced pawn
-                    unplaced_pawns = current_player.get_unplaced_pawns()
-                    if unplaced_pawns:
-                        # Place the pawn
-                        pawn = unplaced_pawns[0]
-                        if game_state.place_pawn(pawn, x, y):
-                            # Show notification about whose turn it is now
-                            next_player = game_state.get_current_player()
-                            self.renderer.show_notification(f"Pawn placed. Player {next_player.player_id}'s turn")
-                            return True
-                    else:
-                        self.renderer.show_error_message("No pawns left to place")
-                        return False
-                else:
-                    self.renderer.show_error_message("Position already occupied")
-                    return False
+            # Pawn moved successfully, selection is cleared
+            game_state.selected_pawn = None
+            
+            # A pawn at an exit point gets the escape hint in place of the plain
+            # move message, keeping the combined line within the window width
+            if game_state.moved_to_exit:
+                messages = ["Pawn at exit point! Click again to escape."]
             else:
-                # Check if there's an opponent's pawn at this position
-                opponent = game_state.get_other_player()
-                opponent_pawn = opponent.get_pawn_at_position(x, y)
-                
-                if opponent_pawn:
-                    # Show error for clicking on opponent's pawn
-                    self.renderer.show_error_message(f"That's Player {opponent.player_id}'s pawn")
-                else:
-                    # Show error for clicking on invalid position
-                    self.renderer.show_error_message(f"Invalid position - Player {current_player.player_id} must place pawns on their starting row")
+                messages = ["Pawn moved"]
+            
+            # Show whose turn it is now
+            next_player = game_state.get_current_player()
+            messages.append(_TURN_MESSAGES[next_player.player_id])
+            self._notify(messages)
+            return True
         
-        return False
\ No newline at end of file
+        # Not a valid destination: select another of the player's pawns, or deselect
+        pawn_at_pos = current_player.get_pawn_at_position(x, y)
+        if pawn_at_pos:
+            self._select_pawn(pawn_at_pos, game_state, board, current_player)
+        else:
+            game_state.selected_pawn = None
+            renderer.show_notification("Pawn deselected")
+        return True
+    
+    def _select_pawn(self, pawn, game_state, board, current_player) -> None:
+        """
+        Select one of the current player's pawns and tell the player about it.
+        
+        Args:
+            pawn: The pawn to select
+            game_state: The current game state
+            board: The game board
+            current_player: The player whose turn it is
+        """
+        game_state.selected_pawn = pawn
+        
+        # Check if this pawn is at an escape position
+        pawn_pos = pawn.get_position()
+        if pawn_pos and board.is_escape_position(pawn_pos[0], pawn_pos[1], current_player):
+            self.renderer.show_notification("Selected pawn at exit point. Click again to escape.")
+        else:
+            self.renderer.show_notification(_SELECTED_MESSAGES[current_player.player_id])
+    
+    def _notify(self, messages: List[str]) -> None:
+        """
+        Show the messages produced by one click as a single notification.
+        
+        The renderer only displays its most recent notification, so showing
+        each message separately would hide all but the last one while still
+        paying for every call.
+        
+        Args:
+            messages: Messages to show, in order
+        """
+        self.renderer.show_notification(" | ".join(messages))
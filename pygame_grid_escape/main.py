@@ -8,6 +8,248 @@ from game_logic.game_state import GameState
 from rendering.renderer import Renderer
 from input.input_handler import InputHandler
 
+
+def _on_quit(event, clicks: list, keys: list, repaints: list) -> bool:
+    """
+    Handle the window being closed.
+    
+    Args:
+        event: The QUIT event
+        clicks: This frame's left click positions
+        keys: This frame's game key presses
+        repaints: This frame's window events that call for a repaint
+        
+    Returns:
+        False, to stop the main loop
+    """
+    return False
+
+
+def _on_mouse_button(event, clicks: list, keys: list, repaints: list) -> bool:
+    """
+    Collect a left click for this frame's batch.
+    
+    Args:
+        event: The MOUSEBUTTONDOWN event
+        clicks: This frame's left click positions
+        keys: This frame's game key presses
+        repaints: This frame's window events that call for a repaint
+        
+    Returns:
+        True, to keep the main loop running
+    """
+    if event.button == 1:  # Left mouse button
+        clicks.append(event.pos)
+    return True
+
+
+def _on_key(event, clicks: list, keys: list, repaints: list) -> bool:
+    """
+    Collect a game key press for this frame's batch.
+    
+    R restarts the game and ESC deselects the selected pawn; other keys
+    are ignored.
+    
+    Args:
+        event: The KEYDOWN event
+        clicks: This frame's left click positions
+        keys: This frame's game key presses
+        repaints: This frame's window events that call for a repaint
+        
+    Returns:
+        True, to keep the main loop running
+    """
+    if event.key in (pygame.K_r, pygame.K_ESCAPE):
+        keys.append(event.key)
+    return True
+
+
+def _on_window_repaint(event, clicks: list, keys: list, repaints: list) -> bool:
+    """
+    Collect the window being uncovered, restored or shown again.
+    
+    Args:
+        event: The WINDOWEXPOSED, WINDOWRESTORED or WINDOWSHOWN event
+        clicks: This frame's left click positions
+        keys: This frame's game key presses
+        repaints: This frame's window events that call for a repaint
+        
+    Returns:
+        True, to keep the main loop running
+    """
+    repaints.append(event)
+    return True
+
+
+# Window events after which the window has to be painted again: it was
+# uncovered, restored from being minimized or shown again
+WINDOW_REPAINT_EVENTS = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN)
+
+# Handler for each event type the main loop acts on, looked up by type
+EVENT_HANDLERS = {
+    pygame.QUIT: _on_quit,
+    pygame.MOUSEBUTTONDOWN: _on_mouse_button,
+    pygame.KEYDOWN: _on_key,
+}
+EVENT_HANDLERS.update(dict.fromkeys(WINDOW_REPAINT_EVENTS, _on_window_repaint))
+
+# The only event types the main loop acts on
+HANDLED_EVENTS = tuple(EVENT_HANDLERS)
+
+# Frame rate cap and the frame length it gives, in milliseconds
+FPS = 60
+FRAME_MS = 1000 // FPS
+
+# Partial display updates only pay off for a few small areas; past either
+# limit one full flip is cheaper than updating rectangle by rectangle
+MAX_UPDATE_RECTS = 15
+MAX_UPDATE_AREA = 0.25
+
+
+def _poll_input(game_state, renderer, input_handler, events: list,
+                previous_dirty: list) -> bool:
+    """
+    Take this frame's events from the queue and apply them to the game.
+    
+    Args:
+        game_state: The current game state
+        renderer: The game renderer
+        input_handler: The input handler that turns clicks and keys into actions
+        events: Events already taken from the queue while waiting for this
+            frame, oldest first; the queued ones are added to it
+        previous_dirty: Screen rectangles drawn in the previous frame; replaced
+            by the whole window when the window has to be painted again
+        
+    Returns:
+        False if the window was closed, True otherwise
+    """
+    # The screen is current and nothing on it animates, so nothing changes
+    # until the next event, including the window being uncovered or shown
+    # again: sleep in SDL until one arrives instead of polling at the frame
+    # rate
+    if not events and not (game_state.dirty or renderer.needs_redraw()):
+        events.append(pygame.event.wait())
+    
+    # Unhandled types are blocked, so the queue only ever holds events the
+    # loop acts on. peek pumps the queue and only answers whether anything
+    # is waiting, so frames without input allocate no event list
+    if pygame.event.peek(HANDLED_EVENTS):
+        events += pygame.event.get(HANDLED_EVENTS)
+    if not events:
+        return True
+    
+    # Collect this frame's input first and hand it to the input handler
+    # in one batch per kind, so it can coalesce redundant key presses
+    running = True
+    clicks = []
+    keys = []
+    repaints = []
+    for event in events:
+        handler = EVENT_HANDLERS.get(event.type)
+        if handler and not handler(event, clicks, keys, repaints):
+            running = False
+    
+    # Whatever the window showed may be gone, so the next frame draws and
+    # pushes all of it; pushing only last frame's areas would leave the rest
+    # blank where the display does not keep the window contents
+    if repaints:
+        previous_dirty[:] = [pygame.display.get_surface().get_rect()]
+        game_state.dirty = True
+    
+    if clicks:
+        input_handler.handle_clicks(clicks, game_state, renderer)
+    if keys:
+        input_handler.handle_keys(keys, game_state, renderer)
+    return running
+
+
+def _draw_playing_frame(game_state, renderer) -> list:
+    """
+    Draw the board, the pawns and the UI.
+    
+    Args:
+        game_state: The current game state
+        renderer: The game renderer
+        
+    Returns:
+        Screen rectangles that were drawn to
+    """
+    dirty = renderer.draw_board(game_state.board)
+    dirty += renderer.draw_pawns(game_state.players)
+    dirty += renderer.draw_ui(game_state)
+    return dirty
+
+
+def _draw_game_over_frame(game_state, renderer) -> list:
+    """
+    Draw the final position with the game over screen on top of it.
+    
+    The overlay is translucent, so the board, pawns and fading messages
+    underneath are still drawn first.
+    
+    Args:
+        game_state: The current game state
+        renderer: The game renderer
+        
+    Returns:
+        Screen rectangles that were drawn to
+    """
+    dirty = _draw_playing_frame(game_state, renderer)
+    dirty += renderer.draw_game_over(game_state)
+    return dirty
+
+
+def _present(rects: list) -> None:
+    """
+    Push the given screen areas to the display.
+    
+    Args:
+        rects: Screen rectangles that changed since the last present
+    """
+    screen_width, screen_height = pygame.display.get_surface().get_size()
+    area = sum(rect.width * rect.height for rect in rects)
+    if (len(rects) < MAX_UPDATE_RECTS
+            and area < MAX_UPDATE_AREA * screen_width * screen_height):
+        pygame.display.update(rects)
+    else:
+        pygame.display.flip()
+
+
+# Frame drawing for each game phase; the phase only changes on a move or a
+# reset, so the loop picks the drawing path with one lookup per frame
+FRAME_DRAWERS = {
+    GameState.PLAYING: _draw_playing_frame,
+    GameState.GAME_OVER: _draw_game_over_frame,
+}
+
+
+def _render(game_state, renderer, previous_dirty: list) -> list:
+    """
+    Draw a frame and push the changed screen areas to the display.
+    
+    Args:
+        game_state: The current game state
+        renderer: The game renderer
+        previous_dirty: Screen rectangles drawn in the previous frame
+        
+    Returns:
+        Screen rectangles drawn in this frame
+    """
+    renderer.begin_frame()
+    
+    # Everything outside last frame's areas is still background
+    renderer.clear(previous_dirty)
+    dirty = FRAME_DRAWERS[game_state.phase](game_state, renderer)
+    
+    # Update only the parts of the display drawn this frame or last frame;
+    # the areas drawn last frame must be pushed again so whatever was
+    # erased from them shows up
+    _present(previous_dirty + dirty)
+    game_state.dirty = False
+    renderer.dirty = False
+    return dirty
+
+
 def main():
     """Main function to initialize and run the game."""
     # Initialize pygame
@@ -15,52 +257,68 @@ def main():
     
     # Set up the display
     screen_width, screen_height = 800, 600
-    screen = pygame.display.set_mode((screen_width, screen_height))
+    # SCALED presents through a GPU texture instead of copying the window
+    # surface on the CPU, and vsync ties presents to the monitor refresh so
+    # frames never tear. Drivers that cannot vsync fall back to a plain window.
+    # Everything drawn per frame is a blit of a cached sprite, so this keeps
+    # the GPU present without moving to the experimental pygame._sdl2 API
+    try:
+        screen = pygame.display.set_mode((screen_width, screen_height),
+                                         pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+    except pygame.error:
+        screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("Grid Escape")
     
+    # Drop every other event type inside SDL so it is never queued; this
+    # is mostly the flood of mouse motion events. The window events that
+    # call for a repaint are handled, so they stay allowed
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENTS)
+    
     # Initialize game components
     game_state = GameState()
     renderer = Renderer(screen)
     input_handler = InputHandler(renderer)
     
     # Main game loop
-    clock = pygame.time.Clock()
     running = True
+    next_frame = pygame.time.get_ticks()
+    
+    # Input that ended the last frame's wait early; handled before the queue
+    woken_by = []
+    
+    # Screen areas drawn in the previous frame; the first frame covers the
+    # whole window
+    previous_dirty = [screen.get_rect()]
     
     while running:
-        # Process events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left mouse button
-                    input_handler.handle_click(event.pos, game_state, renderer)
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:  # R key for restart
-                    game_state.reset_game()
-                    renderer.show_notification("Game restarted")
-                    
-                # Add keyboard shortcuts for other game actions
-                elif event.key == pygame.K_ESCAPE:  # ESC key to deselect pawn
-                    if game_state.selected_pawn:
-                        game_state.selected_pawn = None
-                        renderer.show_notification("Pawn deselected")
+        # Update first so input is polled right before the frame is drawn,
+        # with nothing between taking the newest events and showing them.
+        # Expired messages are also gone by the time the input step decides
+        # whether it can sleep until the next event
+        renderer.update()
+        running = _poll_input(game_state, renderer, input_handler, woken_by, previous_dirty)
         
-        # Render the game
-        screen.fill((240, 240, 240))  # Light gray background
-        renderer.draw_board(game_state.board)
-        renderer.draw_pawns(game_state.players)
-        renderer.draw_ui(game_state)
-        
-        # Draw game over screen if game is over
-        if game_state.is_game_over():
-            renderer.draw_game_over(game_state)
-        
-        # Update the display
-        pygame.display.flip()
+        # Render the game only when something on screen changed
+        if game_state.dirty or renderer.needs_redraw():
+            previous_dirty = _render(game_state, renderer, previous_dirty)
         
-        # Cap the frame rate
-        clock.tick(60)
+        # Cap the frame rate; still needed where vsync is unavailable or
+        # the monitor refreshes faster than 60 Hz. The loop sleeps in SDL
+        # until the next frame is due, but input wakes it at once, so a
+        # click is handled and drawn without waiting out the frame
+        woken_by = []
+        next_frame += FRAME_MS
+        delay = next_frame - pygame.time.get_ticks()
+        if delay > 0:
+            event = pygame.event.wait(delay)
+            if event.type != pygame.NOEVENT:
+                woken_by.append(event)
+                next_frame = pygame.time.get_ticks()
+        else:
+            # Behind schedule, e.g. after sleeping for an event: start the
+            # schedule over instead of rushing frames to catch up
+            next_frame = pygame.time.get_ticks()
     
     # Clean up
     pygame.quit()
@@ -6,6 +6,7 @@ including the board, pawns, UI elements, and visual feedback.
 """
 import pygame
 import time
+from collections import OrderedDict
 from typing import List, Tuple, Optional
 
 class Renderer:
@@ -39,12 +40,32 @@ class Renderer:
     NOTIFICATION_COLOR = (50, 50, 50)   # Dark gray for notifications
     TURN_INDICATOR_BG = (220, 220, 220) # Light gray for turn indicator background
     
+    # Translucent (RGBA) variants of the colors above, built once here
+    # instead of concatenating an alpha onto the RGB tuple at each draw
+    PLAYER1_HIGHLIGHT_A150 = PLAYER1_HIGHLIGHT + (150,)  # Starting positions
+    PLAYER2_HIGHLIGHT_A150 = PLAYER2_HIGHLIGHT + (150,)
+    PLAYER1_HIGHLIGHT_A50 = PLAYER1_HIGHLIGHT + (50,)    # Starting row
+    PLAYER2_HIGHLIGHT_A50 = PLAYER2_HIGHLIGHT + (50,)
+    VALID_MOVE_COLOR_A100 = VALID_MOVE_COLOR + (100,)    # Valid move fill
+    HIGHLIGHT_GLOW_COLORS = (HIGHLIGHT_COLOR + (100,),   # Selection glow rings,
+                             HIGHLIGHT_COLOR + (70,),    # innermost first
+                             HIGHLIGHT_COLOR + (40,))
+    
     # UI settings
     PAWN_RADIUS = 15
     HIGHLIGHT_RADIUS = 18
     VALID_MOVE_RADIUS = 10
     STARTING_POS_RADIUS = 12
     PULSING_HIGHLIGHT_MAX = 22          # Maximum radius for pulsing highlight effect
+    ERROR_DURATION = 3                  # Seconds an error message stays up
+    NOTIFICATION_DURATION = 2           # Seconds a notification stays up
+    TEXT_CACHE_SIZE = 64                # Rendered UI labels kept for reuse
+    
+    # Intersections where a pawn gets the pulsing escape highlight, by player ID
+    _ESCAPE_HIGHLIGHT_POSITIONS = {
+        1: frozenset((x, 0) for x in range(1, 6)),  # Top edge
+        2: frozenset((0, y) for y in range(1, 6)),  # Left edge
+    }
     
     def __init__(self, screen: pygame.Surface):
         """
@@ -63,136 +84,474 @@ class Renderer:
         self.board_y = (self.WINDOW_HEIGHT - self.BOARD_SIZE) // 2
         self.cell_size = self.BOARD_SIZE // (self.GRID_LINES - 1)
         
+        # Pixel coordinates of every intersection, computed once so drawing
+        # a pawn is a single lookup
+        self._intersection_pixels = {
+            (x, y): (self.board_x + x * self.cell_size, self.board_y + y * self.cell_size)
+            for x in range(self.GRID_LINES) for y in range(self.GRID_LINES)
+        }
+        
+        # Nearest grid line for every pixel offset along an axis at which a
+        # click can land on the board, starting PAWN_RADIUS before the first
+        # line; None where the nearest line would be off the grid
+        reach = self.PAWN_RADIUS
+        self._pixel_offset_lines = tuple(
+            line if 0 <= line < self.GRID_LINES else None
+            for line in (round(offset / self.cell_size)
+                         for offset in range(-reach, self.BOARD_SIZE + reach + 1))
+        )
+        self._pixel_lookup_x = self.board_x - reach
+        self._pixel_lookup_y = self.board_y - reach
+        
+        # Screen area the board can draw to: the grid, the edge markers and
+        # everything drawn around intersections (pawns and their highlights)
+        margin = self.PULSING_HIGHLIGHT_MAX + 3
+        self.board_rect = pygame.Rect(self.board_x - margin, self.board_y - margin,
+                                      self.BOARD_SIZE + 2 * margin, self.BOARD_SIZE + 2 * margin)
+        
+        # Escaped pawns counter: top left corner and distance between lines
+        self._counter_pos = (self.WINDOW_WIDTH - 220, 100)
+        self._counter_spacing = 30
+        
+        # Turn skipped panel, centered above the bottom edge, and the centers
+        # of its two text lines
+        panel_width, panel_height = 300, 60
+        self._skip_panel_rect = pygame.Rect((self.WINDOW_WIDTH - panel_width) // 2,
+                                            self.WINDOW_HEIGHT - panel_height - 40,
+                                            panel_width, panel_height)
+        self._skip_text_center = (self._skip_panel_rect.centerx, self._skip_panel_rect.y + 20)
+        self._skip_reason_center = (self._skip_panel_rect.centerx, self._skip_panel_rect.y + 40)
+        
+        # Plain background, built once in the screen's pixel format so
+        # erasing is a straight copy with no per-pixel conversion
+        self._background = pygame.Surface(screen.get_size()).convert(screen)
+        self._background.fill(self.BACKGROUND_COLOR)
+        
+        # Grid, spawn points and exit points; none of them depend on the game
+        self._board_surface = self._build_board_surface()
+        
         # UI state variables
         self.error_message = None
         self.error_time = 0
         self.notification_message = None
         self.notification_time = 0
         self.pulse_time = 0  # For pulsing effects
+        
+        # Clock readings for the frame being drawn; see begin_frame
+        self.begin_frame()
+        
+        # Rendered text of the current messages, made once when each is shown
+        # since the fade only changes their alpha, and the error's background;
+        # all are released again when their message expires
+        self._error_surface = None
+        self._error_background = None
+        self._notification_surface = None
+        
+        # Rendered UI text keyed by (font, text, color), least recently
+        # used first; see _render_text
+        self._text_cache = OrderedDict()
+        
+        # Fixed labels, rendered up front so even the first frames that
+        # show them only blit
+        for font, text, color in ((self.small_font, "Current Turn", self.TEXT_COLOR),
+                                  (self.font, "Escaped Pawns", self.TEXT_COLOR),
+                                  (self.small_font, "No valid moves available", (200, 200, 200))):
+            self._render_text(font, text, color)
+        
+        # Every escaped pawns counter line, "Player N: K/7" for K = 0 to 7,
+        # by player ID and then K, so a count change only picks another one
+        self._counter_labels = {
+            player_id: tuple(
+                self.font.render(f"Player {player_id}: {count}/7", True, color)
+                .convert_alpha(screen)
+                for count in range(8)
+            )
+            for player_id, color in ((1, self.PLAYER1_COLOR), (2, self.PLAYER2_COLOR))
+        }
+        
+        # Set when a new message needs drawing; cleared by the main loop
+        self.dirty = True
+        
+        # Text on an opaque background, composited into one surface; keyed
+        # like the text cache plus the background color, see _get_text_panel
+        self._text_panels = {}
+        
+        # Circles keyed by (color, radius, width), translucent rectangles
+        # keyed by (color, size) and the selection glow keyed by its pixel
+        # sizes, rendered once in the screen's format and blitted each frame
+        self._circle_sprites = {}
+        self._rect_sprites = {}
+        self._glow_sprites = {}
+        
+        # Free starting positions drawn by highlight_valid_starting_positions
+        # and the (board, board version, player ID) they were found for
+        self._starting_positions = []
+        self._starting_positions_key = None
+        
+        # Translucent panel behind the setup phase instructions, built on
+        # first use
+        self._instruction_bg = None
+        
+        # Escaped pawns counter drawn by draw_escaped_pawns_counter, the
+        # escape counts it shows and the game state token they were read at
+        self._counter_panel = None
+        self._counter_counts = None
+        self._counter_token = None
+        
+        # Turn skipped notifications keyed by player ID; see
+        # _get_skip_notification
+        self._skip_notifications = {}
+        
+        # Turn indicator panels keyed by player ID; see _get_turn_indicator
+        self._turn_indicators = {}
+        
+        # Game over screens drawn by draw_game_over, keyed by the outcome
+        # they show; there are only a few, so later games reuse them
+        self._game_over_surfaces = {}
+        
+        # Whether the last frame drew a pulsing highlight, which has to be
+        # redrawn every frame; set by draw_pawns and draw_ui
+        self._animating = False
+    
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface if it was rendered before.
+        
+        UI labels are redrawn every frame but rarely change, so most calls
+        are a dictionary hit instead of rasterizing glyphs. Callers must not
+        modify the returned surface.
+        
+        Args:
+            font: The font to render with
+            text: The text to render
+            color: RGB text color
+            
+        Returns:
+            Surface holding the rendered text, in the screen's pixel format
+        """
+        key = (font, text, color)
+        text_cache = self._text_cache
+        surface = text_cache.get(key)
+        if surface is not None:
+            text_cache.move_to_end(key)
+            return surface
+        
+        # Labels embed counts and player IDs, so the set of strings is
+        # small; the bound only guards against unexpected growth, and drops
+        # the least recently drawn label so the per-frame ones stay cached
+        if len(text_cache) >= self.TEXT_CACHE_SIZE:
+            text_cache.popitem(last=False)
+        surface = font.render(text, True, color).convert_alpha(self.screen)
+        text_cache[key] = surface
+        return surface
+    
+    def _get_text_panel(self, font: pygame.font.Font, text: str,
+                        color: Tuple[int, int, int],
+                        bg_color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get text on a padded opaque background, rendering it on first use.
+        
+        Each panel is cached separately, so switching back to a label shown
+        before (e.g. the phase after a restart) is still one blit.
+        
+        Args:
+            font: The font to render with
+            text: The text to render
+            color: RGB text color
+            bg_color: RGB background color
+            
+        Returns:
+            Surface 20 pixels wider and 10 taller than the text, holding the
+            text on the background, in the screen's pixel format
+        """
+        key = (font, text, color, bg_color)
+        panel = self._text_panels.get(key)
+        if panel is None:
+            text_surface = self._render_text(font, text, color)
+            panel = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 10))
+            panel.fill(bg_color)
+            panel.blit(text_surface, (10, 5))
+            panel = self._text_panels[key] = panel.convert(self.screen)
+        return panel
+    
+    def begin_frame(self) -> None:
+        """
+        Sample the clock once for the frame about to be drawn.
+        
+        Pulses and fades read these values instead of the clock, so the
+        clock is read once per frame rather than once per pawn, highlight
+        and message, and everything in a frame shows the same instant.
+        """
+        ticks = pygame.time.get_ticks()
+        self.frame_ticks = ticks
+        self.frame_time = time.time()
+        self._pulse_1000 = (ticks % 1000) / 1000  # 0 to 1 over 1 second
+        self._pulse_1500 = (ticks % 1500) / 1500  # 0 to 1 over 1.5 seconds
+    
+    def clear(self, rects: List[pygame.Rect]) -> None:
+        """
+        Erase areas of the screen back to the background.
+        
+        Only the areas drawn in the previous frame hold anything but
+        background, so erasing just those replaces filling the whole screen.
+        Areas inside the board are skipped: draw_board, which follows in
+        every frame, covers the whole board area with an opaque surface.
+        
+        Args:
+            rects: Screen rectangles to erase
+        """
+        background = self._background
+        board_rect = self.board_rect
+        self.screen.blits([(background, rect, rect) for rect in rects
+                           if not board_rect.contains(rect)], False)
     
-    def draw_board(self, board):
+    def draw_board(self, board) -> List[pygame.Rect]:
         """
         Draw the game board with grid lines.
         
+        The board never changes, so it is drawn once into a cached surface
+        and copied to the screen with a single blit.
+        
         Args:
             board: The game board object
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
-        # Draw grid lines
+        self.screen.blit(self._board_surface, self.board_rect)
+        return [self.board_rect]
+    
+    def _build_board_surface(self) -> pygame.Surface:
+        """
+        Draw the grid lines, spawn points and exit points onto a new surface.
+        
+        Returns:
+            Opaque surface covering board_rect, in the screen's pixel format
+        """
+        surface = pygame.Surface(self.board_rect.size).convert(self.screen)
+        surface.fill(self.BACKGROUND_COLOR)
+        
+        # Board origin relative to the surface's top left corner
+        board_x = self.board_x - self.board_rect.x
+        board_y = self.board_y - self.board_rect.y
+        
+        # Draw grid lines as two polylines, one per direction. Each line is
+        # traced out and back, so the polyline steps to the next one along
+        # the first grid line of the other direction, which is drawn anyway
+        board_end_x = board_x + self.BOARD_SIZE
+        board_end_y = board_y + self.BOARD_SIZE
+        horizontal_points = []
+        vertical_points = []
         for i in range(self.GRID_LINES):
             # Calculate position for this grid line
-            x = self.board_x + i * self.cell_size
-            y = self.board_y + i * self.cell_size
-            
-            # Draw horizontal line
-            pygame.draw.line(
-                self.screen, 
-                self.GRID_COLOR, 
-                (self.board_x, y), 
-                (self.board_x + self.BOARD_SIZE, y), 
-                2
-            )
-            
-            # Draw vertical line
-            pygame.draw.line(
-                self.screen, 
-                self.GRID_COLOR, 
-                (x, self.board_y), 
-                (x, self.board_y + self.BOARD_SIZE), 
-                2
-            )
+            x = board_x + i * self.cell_size
+            y = board_y + i * self.cell_size
+            horizontal_points += [(board_x, y), (board_end_x, y), (board_x, y)]
+            vertical_points += [(x, board_y), (x, board_end_y), (x, board_y)]
+        pygame.draw.lines(surface, self.GRID_COLOR, False, horizontal_points, 2)
+        pygame.draw.lines(surface, self.GRID_COLOR, False, vertical_points, 2)
+        
+        # Offsets of the five inner intersections along an edge and of the
+        # far edge, shared by the spawn and exit markers
+        marker_offsets = [i * self.cell_size for i in range(1, 6)]
+        far_edge = 6 * self.cell_size
         
         # Draw spawn points (circles) at the bottom and right
-        for i in range(1, 6):
+        for offset in marker_offsets:
             # Bottom spawn points for Player 1
             pygame.draw.circle(
-                self.screen,
+                surface,
                 self.PLAYER1_COLOR,
-                (self.board_x + i * self.cell_size, self.board_y + 6 * self.cell_size),
+                (board_x + offset, board_y + far_edge),
                 8,
                 2
             )
             
             # Right spawn points for Player 2
             pygame.draw.circle(
-                self.screen,
+                surface,
                 self.PLAYER2_COLOR,
-                (self.board_x + 6 * self.cell_size, self.board_y + i * self.cell_size),
+                (board_x + far_edge, board_y + offset),
                 8,
                 2
             )
         
         # Draw exit points (arrow heads) at the top and left
         arrow_size = 8
-        for i in range(1, 6):
+        for offset in marker_offsets:
             # Top exit points for Player 1
             # Draw arrow head pointing up
+            top_x = board_x + offset
             pygame.draw.polygon(
-                self.screen,
+                surface,
                 self.PLAYER1_COLOR,
                 [
-                    (self.board_x + i * self.cell_size, self.board_y - arrow_size),
-                    (self.board_x + i * self.cell_size - arrow_size, self.board_y),
-                    (self.board_x + i * self.cell_size + arrow_size, self.board_y)
+                    (top_x, board_y - arrow_size),
+                    (top_x - arrow_size, board_y),
+                    (top_x + arrow_size, board_y)
                 ],
                 2
             )
             
             # Left exit points for Player 2
             # Draw arrow head pointing left
+            left_y = board_y + offset
             pygame.draw.polygon(
-                self.screen,
+                surface,
                 self.PLAYER2_COLOR,
                 [
-                    (self.board_x - arrow_size, self.board_y + i * self.cell_size),
-                    (self.board_x, self.board_y + i * self.cell_size - arrow_size),
-                    (self.board_x, self.board_y + i * self.cell_size + arrow_size)
+                    (board_x - arrow_size, left_y),
+                    (board_x, left_y - arrow_size),
+                    (board_x, left_y + arrow_size)
                 ],
                 2
             )
+        
+        return surface
     
-    def draw_pawns(self, players: List):
+    def draw_pawns(self, players: List) -> List[pygame.Rect]:
         """
         Draw all pawns on the board.
         
+        Pawns and their escape highlights stay inside the board area, which
+        draw_board already reports, so the batch is built without a
+        rectangle per pawn.
+        
         Args:
             players: List of player objects
+            
+        Returns:
+            List of screen rectangles that were drawn to outside the board
+            area; always empty
         """
+        sprites = []
+        escape_centers = []
+        intersection_pixels = self._intersection_pixels
+        radius = self.PAWN_RADIUS
         for player in players:
-            # Draw pawns that are on the board
+            sprite = self._get_circle_sprite(player.color, radius)
+            escape_positions = self._ESCAPE_HIGHLIGHT_POSITIONS.get(player.player_id, ())
+            
+            # Collect pawns that are on the board
             for pawn in player.get_pawns_on_board():
                 position = pawn.get_position()
                 if position:
-                    x, y = position
-                    screen_x = self.board_x + x * self.cell_size
-                    screen_y = self.board_y + y * self.cell_size
+                    screen_x, screen_y = intersection_pixels[position]
+                    sprites.append((sprite, (screen_x - radius, screen_y - radius)))
                     
                     # Check if the pawn is at an escape position
-                    is_at_escape = False
-                    if (player.player_id == 1 and y == 0 and 1 <= x <= 5) or \
-                       (player.player_id == 2 and x == 0 and 1 <= y <= 5):
-                        is_at_escape = True
-                    
-                    # Draw the pawn
-                    pygame.draw.circle(
-                        self.screen,
-                        player.color,
-                        (screen_x, screen_y),
-                        self.PAWN_RADIUS
-                    )
-                    
-                    # If the pawn is at an escape position, draw a highlight around it
-                    if is_at_escape:
-                        # Draw a pulsing glow effect
-                        pulse_factor = (pygame.time.get_ticks() % 1000) / 1000  # 0 to 1 over 1 second
-                        pulse_radius = self.PAWN_RADIUS + 3 * abs(pulse_factor - 0.5)  # Pulse between sizes
-                        
-                        pygame.draw.circle(
-                            self.screen,
-                            (255, 255, 0),  # Yellow highlight
-                            (screen_x, screen_y),
-                            pulse_radius,
-                            2
-                        )
+                    if position in escape_positions:
+                        escape_centers.append((screen_x, screen_y))
+        
+        # Draw every pawn in one call; pawns never overlap, so the order
+        # they are drawn in does not matter
+        self.screen.blits(sprites, False)
+        
+        # If a pawn is at an escape position, draw a highlight around it
+        animating = bool(escape_centers)
+        if animating:
+            # Draw a pulsing glow effect
+            pulse_factor = self._pulse_1000  # 0 to 1 over 1 second
+            pulse_radius = self.PAWN_RADIUS + 3 * abs(pulse_factor - 0.5)  # Pulse between sizes
+            
+            for center in escape_centers:
+                pygame.draw.circle(
+                    self.screen,
+                    (255, 255, 0),  # Yellow highlight
+                    center,
+                    pulse_radius,
+                    2
+                )
+        
+        self._animating = animating
+        return []
+    
+    def _get_circle_sprite(self, color: Tuple[int, ...], radius: int,
+                           width: int = 0) -> pygame.Surface:
+        """
+        Get a pre-rendered circle, rendering it on first use.
+        
+        Args:
+            color: RGB color, or RGBA for a translucent circle
+            radius: Circle radius in pixels
+            width: Outline thickness, or 0 for a filled circle
+            
+        Returns:
+            Surface with per-pixel alpha, 2 * radius wide, holding the circle
+            centered in it
+        """
+        key = (color, radius, width)
+        sprite = self._circle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius, width)
+            sprite = self._circle_sprites[key] = sprite.convert_alpha(self.screen)
+        return sprite
+    
+    def _get_rect_sprite(self, color: Tuple[int, int, int, int],
+                         size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Get a pre-rendered translucent rectangle, rendering it on first use.
+        
+        Args:
+            color: RGBA fill color
+            size: (width, height) of the rectangle in pixels
+            
+        Returns:
+            Surface with per-pixel alpha filled with the color
+        """
+        key = (color, size)
+        sprite = self._rect_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            sprite.fill(color)
+            sprite = self._rect_sprites[key] = sprite.convert_alpha(self.screen)
+        return sprite
+    
+    def _get_glow_sprite(self, pulse_radius: float) -> pygame.Surface:
+        """
+        Get the selected pawn's glow for a pulse radius, rendering it on first use.
+        
+        The glow only depends on a few whole-pixel sizes derived from the
+        radius, so the pulse cycles through a handful of cached surfaces.
+        The solid highlight circle is baked into each of them, so the whole
+        highlight is a single blit.
+        
+        Args:
+            pulse_radius: Current radius of the pulsing highlight
+            
+        Returns:
+            Surface with per-pixel alpha holding three concentric rings
+            around the solid highlight circle
+        """
+        size = int(pulse_radius * 2.5)
+        center = int(pulse_radius * 1.25)
+        ring_sizes = tuple(int(pulse_radius * (1 + i * 0.2)) for i in range(3))
+        key = (size, center, ring_sizes)
+        glow_surface = self._glow_sprites.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            for ring_color, ring_size in zip(self.HIGHLIGHT_GLOW_COLORS, ring_sizes):
+                pygame.draw.circle(
+                    glow_surface,
+                    ring_color,
+                    (center, center),
+                    ring_size,
+                    2
+                )
+            
+            # The solid circle is opaque, so drawing it here gives the same
+            # pixels as drawing it on the screen over the glow
+            pygame.draw.circle(
+                glow_surface,
+                self.HIGHLIGHT_COLOR,
+                (center, center),
+                self.HIGHLIGHT_RADIUS,
+                2
+            )
+            glow_surface = self._glow_sprites[key] = glow_surface.convert_alpha(self.screen)
+        return glow_surface
     
     def highlight_selected_pawn(self, pawn):
         """
@@ -215,12 +574,18 @@ class Renderer:
         # Use the enhanced valid moves visualization
         self.draw_enhanced_valid_moves(valid_moves)
     
-    def draw_ui(self, game_state):
+    def draw_ui(self, game_state) -> List[pygame.Rect]:
         """
         Draw UI elements based on the current game state.
         
+        Selection and placement highlights stay inside the board area, which
+        draw_board already reports, so only the panels around it are returned.
+        
         Args:
             game_state: The current game state
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
         # Draw current phase with enhanced styling
         phase_text = ""
@@ -237,22 +602,21 @@ class Renderer:
             else:
                 phase_text = "Game Over"
         
-        # Draw phase text with a background
-        phase_surface = self.font.render(phase_text, True, self.TEXT_COLOR)
-        phase_bg = pygame.Surface((phase_surface.get_width() + 20, phase_surface.get_height() + 10))
-        phase_bg.fill(self.TURN_INDICATOR_BG)
-        self.screen.blit(phase_bg, (15, 15))
-        self.screen.blit(phase_surface, (25, 20))
+        # Draw phase text with a background, both in one prebuilt panel
+        phase_panel = self._get_text_panel(self.font, phase_text, self.TEXT_COLOR,
+                                           self.TURN_INDICATOR_BG)
+        dirty = [self.screen.blit(phase_panel, (15, 15))]
         
         # Draw enhanced turn indicator
-        self.draw_enhanced_turn_indicator(game_state)
+        dirty += self.draw_enhanced_turn_indicator(game_state)
         
         # Draw escaped pawns counter (only in movement phase)
         if game_state.is_movement_phase() or game_state.is_game_over():
-            self.draw_escaped_pawns_counter(game_state)
+            dirty += self.draw_escaped_pawns_counter(game_state)
         
         # Draw selected pawn indicator if a pawn is selected
         if game_state.selected_pawn:
+            self._animating = True
             self.highlight_selected_pawn(game_state.selected_pawn)
             
             # Draw valid moves for the selected pawn
@@ -268,43 +632,74 @@ class Renderer:
             
             # Draw pawn counter
             setup_text = f"Player {current_player.player_id}: {placed_pawns}/{total_pawns} pawns placed"
-            setup_surface = self.font.render(setup_text, True, current_player.color)
-            self.screen.blit(setup_surface, (20, 80))
+            setup_surface = self._render_text(self.font, setup_text, current_player.color)
+            dirty.append(self.screen.blit(setup_surface, (20, 80)))
             
             # Show instructions for setup phase with enhanced styling
-            instruction_bg = pygame.Surface((400, 30))
-            instruction_bg.fill(self.TURN_INDICATOR_BG)
-            instruction_bg.set_alpha(180)
-            self.screen.blit(instruction_bg, (20, 110))
+            if self._instruction_bg is None:
+                instruction_bg = pygame.Surface((400, 30)).convert(self.screen)
+                instruction_bg.fill(self.TURN_INDICATOR_BG)
+                instruction_bg.set_alpha(180)
+                self._instruction_bg = instruction_bg
+            dirty.append(self.screen.blit(self._instruction_bg, (20, 110)))
             
             instruction_text = "Click on your starting row to place pawns"
-            instruction_surface = self.font.render(instruction_text, True, self.TEXT_COLOR)
-            self.screen.blit(instruction_surface, (25, 115))
+            instruction_surface = self._render_text(self.font, instruction_text, self.TEXT_COLOR)
+            dirty.append(self.screen.blit(instruction_surface, (25, 115)))
             
             # Show progress for both players
-            self.draw_setup_progress(game_state)
+            dirty += self.draw_setup_progress(game_state)
             
             # Highlight valid starting positions
             self.highlight_valid_starting_positions(game_state)
         
         # Draw turn skipped notification if applicable
         if game_state.is_movement_phase() and game_state.turn_skipped:
-            self.draw_turn_skipped_notification(game_state.skipped_player_id)
+            dirty += self.draw_turn_skipped_notification(game_state.skipped_player_id)
         
         # Draw any active error messages or notifications
-        self.draw_error_and_notifications()
+        dirty += self.draw_error_and_notifications()
+        
+        return dirty
     
-    def draw_game_over(self, game_state):
+    def draw_game_over(self, game_state) -> List[pygame.Rect]:
         """
         Draw game over screen with winner announcement or stalemate.
         
+        The overlay and panel are rendered once per outcome and reused for
+        every later frame and game that ends the same way.
+        
         Args:
             game_state: The current game state
+            
+        Returns:
+            List of screen rectangles that were drawn to
+        """
+        winner = game_state.get_winner()
+        outcome = (winner.player_id if winner else None,
+                   winner.escaped_pawn_count if winner else 0,
+                   game_state.stalemate)
+        surface = self._game_over_surfaces.get(outcome)
+        if surface is None:
+            surface = self._build_game_over_surface(game_state)
+            self._game_over_surfaces[outcome] = surface
+        
+        return [self.screen.blit(surface, (0, 0))]
+    
+    def _build_game_over_surface(self, game_state) -> pygame.Surface:
+        """
+        Render the game over overlay and panel for the game's outcome.
+        
+        Args:
+            game_state: The current game state
+            
+        Returns:
+            Window-sized surface with per-pixel alpha: the semi-transparent
+            overlay with the opaque panel on top of it
         """
         # Create a semi-transparent overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        surface = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 128))  # Semi-transparent black
         
         # Create a game over panel
         panel_width = 400
@@ -314,7 +709,7 @@ class Renderer:
         
         # Draw panel background
         pygame.draw.rect(
-            self.screen,
+            surface,
             (240, 240, 240),  # Light gray
             (panel_x, panel_y, panel_width, panel_height),
             border_radius=15
@@ -322,7 +717,7 @@ class Renderer:
         
         # Draw panel border
         pygame.draw.rect(
-            self.screen,
+            surface,
             (100, 100, 100),  # Dark gray
             (panel_x, panel_y, panel_width, panel_height),
             width=3,
@@ -331,41 +726,43 @@ class Renderer:
         
         # Draw game over title
         title_text = "Game Over"
-        title_surface = self.large_font.render(title_text, True, self.TEXT_COLOR)
+        title_surface = self._render_text(self.large_font, title_text, self.TEXT_COLOR)
         title_rect = title_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 40))
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
         
         winner = game_state.get_winner()
         if winner:
             # Draw winner announcement
             text = f"Player {winner.player_id} Wins!"
-            text_surface = self.large_font.render(text, True, winner.color)
+            text_surface = self._render_text(self.large_font, text, winner.color)
             text_rect = text_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 90))
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
             
             # Draw stats
-            stats_text = f"Escaped {len(winner.get_escaped_pawns())}/7 pawns"
-            stats_surface = self.font.render(stats_text, True, self.TEXT_COLOR)
+            stats_text = f"Escaped {winner.escaped_pawn_count}/7 pawns"
+            stats_surface = self._render_text(self.font, stats_text, self.TEXT_COLOR)
             stats_rect = stats_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 130))
-            self.screen.blit(stats_surface, stats_rect)
+            surface.blit(stats_surface, stats_rect)
         elif game_state.stalemate:
             # Draw stalemate announcement
             text = "Stalemate - No player can move!"
-            text_surface = self.font.render(text, True, self.TEXT_COLOR)
+            text_surface = self._render_text(self.font, text, self.TEXT_COLOR)
             text_rect = text_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 90))
-            self.screen.blit(text_surface, text_rect)
+            surface.blit(text_surface, text_rect)
             
             # Draw explanation
             explanation = "Both players are blocked"
-            explanation_surface = self.font.render(explanation, True, self.TEXT_COLOR)
+            explanation_surface = self._render_text(self.font, explanation, self.TEXT_COLOR)
             explanation_rect = explanation_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 130))
-            self.screen.blit(explanation_surface, explanation_rect)
+            surface.blit(explanation_surface, explanation_rect)
         
         # Draw restart instructions
         restart_text = "Press R to play again"
-        restart_surface = self.font.render(restart_text, True, self.TEXT_COLOR)
+        restart_surface = self._render_text(self.font, restart_text, self.TEXT_COLOR)
         restart_rect = restart_surface.get_rect(center=(self.WINDOW_WIDTH // 2, panel_y + 170))
-        self.screen.blit(restart_surface, restart_rect)
+        surface.blit(restart_surface, restart_rect)
+        
+        return surface.convert_alpha(self.screen)
     
     def highlight_valid_starting_positions(self, game_state):
         """
@@ -378,42 +775,45 @@ class Renderer:
             return
             
         current_player = game_state.get_current_player()
-        valid_positions = game_state.board.get_all_starting_positions(current_player)
-        
-        # Filter out positions that are already occupied
-        valid_positions = [pos for pos in valid_positions 
-                          if game_state.board.is_intersection_empty(pos[0], pos[1])]
+        board = game_state.board
+        
+        # Filter out positions that are already occupied; the result only
+        # changes when the board does, so it is reused until then
+        key = (board, board.version, current_player.player_id)
+        if key != self._starting_positions_key:
+            valid_positions = board.get_all_starting_positions(current_player)
+            self._starting_positions = [pos for pos in valid_positions 
+                                        if board.is_intersection_empty(pos[0], pos[1])]
+            self._starting_positions_key = key
+        valid_positions = self._starting_positions
         
         # Use a different color for starting positions - light blue for player 1, light red for player 2
         if current_player.player_id == 1:
-            highlight_color = self.PLAYER1_HIGHLIGHT
+            highlight_color = self.PLAYER1_HIGHLIGHT_A150
         else:
-            highlight_color = self.PLAYER2_HIGHLIGHT
+            highlight_color = self.PLAYER2_HIGHLIGHT_A150
             
+        # A filled circle with some transparency, the same for every position
+        s = self._get_circle_sprite(highlight_color, self.STARTING_POS_RADIUS)
+        
         # Draw highlights for valid starting positions
-        for x, y in valid_positions:
-            screen_x = self.board_x + x * self.cell_size
-            screen_y = self.board_y + y * self.cell_size
-            
-            # Draw a filled circle with some transparency
-            s = pygame.Surface((self.STARTING_POS_RADIUS * 2, self.STARTING_POS_RADIUS * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                s,
-                highlight_color + (150,),  # Add alpha value for transparency
-                (self.STARTING_POS_RADIUS, self.STARTING_POS_RADIUS),
-                self.STARTING_POS_RADIUS
-            )
+        intersection_pixels = self._intersection_pixels
+        for position in valid_positions:
+            screen_x, screen_y = intersection_pixels[position]
             self.screen.blit(s, (screen_x - self.STARTING_POS_RADIUS, screen_y - self.STARTING_POS_RADIUS))
         
         # Highlight the entire starting row with a subtle glow
         self.highlight_starting_row(game_state)
     
-    def draw_setup_progress(self, game_state):
+    def draw_setup_progress(self, game_state) -> List[pygame.Rect]:
         """
         Draw a visual representation of setup progress for both players.
         
         Args:
             game_state: The current game state
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
         # Position for the progress bars
         progress_x = 20
@@ -429,7 +829,7 @@ class Renderer:
         
         # Draw player 1 label
         player1_text = f"Player 1:"
-        player1_surface = self.font.render(player1_text, True, player1.color)
+        player1_surface = self._render_text(self.font, player1_text, player1.color)
         self.screen.blit(player1_surface, (progress_x, progress_y))
         
         # Draw player 1 progress bar background
@@ -450,7 +850,7 @@ class Renderer:
         
         # Draw player 1 progress text
         progress_text1 = f"{placed_pawns1}/7"
-        progress_surface1 = self.font.render(progress_text1, True, self.TEXT_COLOR)
+        progress_surface1 = self._render_text(self.font, progress_text1, self.TEXT_COLOR)
         text_x1 = progress_x + 100 + (bar_width // 2) - (progress_surface1.get_width() // 2)
         self.screen.blit(progress_surface1, (text_x1, progress_y))
         
@@ -461,7 +861,7 @@ class Renderer:
         
         # Draw player 2 label
         player2_text = f"Player 2:"
-        player2_surface = self.font.render(player2_text, True, player2.color)
+        player2_surface = self._render_text(self.font, player2_text, player2.color)
         self.screen.blit(player2_surface, (progress_x, progress_y + spacing))
         
         # Draw player 2 progress bar background
@@ -482,9 +882,12 @@ class Renderer:
         
         # Draw player 2 progress text
         progress_text2 = f"{placed_pawns2}/7"
-        progress_surface2 = self.font.render(progress_text2, True, self.TEXT_COLOR)
+        progress_surface2 = self._render_text(self.font, progress_text2, self.TEXT_COLOR)
         text_x2 = progress_x + 100 + (bar_width // 2) - (progress_surface2.get_width() // 2)
         self.screen.blit(progress_surface2, (text_x2, progress_y + spacing))
+        
+        # Both rows: labels on the left, bars to their right
+        return [pygame.Rect(progress_x, progress_y, 100 + bar_width, spacing + bar_height)]
     
     def highlight_starting_row(self, game_state):
         """
@@ -503,9 +906,9 @@ class Renderer:
         
         # Use a different color for each player
         if current_player.player_id == 1:
-            highlight_color = self.PLAYER1_HIGHLIGHT
+            highlight_color = self.PLAYER1_HIGHLIGHT_A50
         else:
-            highlight_color = self.PLAYER2_HIGHLIGHT
+            highlight_color = self.PLAYER2_HIGHLIGHT_A50
             
         # Create a semi-transparent surface for the row highlight
         row_width = self.BOARD_SIZE
@@ -516,8 +919,7 @@ class Renderer:
         row_screen_y = self.board_y + row_y * self.cell_size - row_height // 2
         
         # Create a semi-transparent surface
-        s = pygame.Surface((row_width, row_height), pygame.SRCALPHA)
-        s.fill(highlight_color + (50,))  # Very transparent
+        s = self._get_rect_sprite(highlight_color, (row_width, row_height))  # Very transparent
         
         # Draw the highlight
         self.screen.blit(s, (row_x, row_screen_y))
@@ -533,20 +935,20 @@ class Renderer:
             (grid_x, grid_y) tuple or None if outside the grid
         """
         x, y = pixel_pos
+        lines = self._pixel_offset_lines
         
         # Check if click is within board bounds
-        if (x < self.board_x - self.PAWN_RADIUS or 
-            x > self.board_x + self.BOARD_SIZE + self.PAWN_RADIUS or
-            y < self.board_y - self.PAWN_RADIUS or
-            y > self.board_y + self.BOARD_SIZE + self.PAWN_RADIUS):
+        column = x - self._pixel_lookup_x
+        row = y - self._pixel_lookup_y
+        if not (0 <= column < len(lines) and 0 <= row < len(lines)):
             return None
         
-        # Calculate grid position
-        grid_x = round((x - self.board_x) / self.cell_size)
-        grid_y = round((y - self.board_y) / self.cell_size)
+        # Look up the nearest grid lines instead of dividing and rounding
+        grid_x = lines[column]
+        grid_y = lines[row]
         
         # Check if position is valid (0-6)
-        if 0 <= grid_x < 7 and 0 <= grid_y < 7:
+        if grid_x is not None and grid_y is not None:
             return (grid_x, grid_y)
         
         return None
@@ -562,6 +964,11 @@ class Renderer:
         Returns:
             (pixel_x, pixel_y) tuple of pixel coordinates
         """
+        pixel = self._intersection_pixels.get((grid_x, grid_y))
+        if pixel is not None:
+            return pixel
+        
+        # Off-grid coordinates are not in the table
         pixel_x = self.board_x + grid_x * self.cell_size
         pixel_y = self.board_y + grid_y * self.cell_size
         return (pixel_x, pixel_y)
@@ -574,7 +981,16 @@ class Renderer:
             message: The error message to display
         """
         self.error_message = message
+        self._error_surface = self.font.render(
+            message, True, self.ERROR_COLOR).convert_alpha(self.screen)
+        
+        # Background sized to the text; refilled with the fading alpha each
+        # frame instead of being allocated again
+        self._error_background = pygame.Surface(
+            (self._error_surface.get_width() + 20, self._error_surface.get_height() + 10),
+            pygame.SRCALPHA).convert_alpha(self.screen)
         self.error_time = time.time()
+        self.dirty = True
     
     def show_notification(self, message: str) -> None:
         """
@@ -584,26 +1000,76 @@ class Renderer:
             message: The notification message to display
         """
         self.notification_message = message
+        self._notification_surface = self.font.render(
+            message, True, self.NOTIFICATION_COLOR).convert_alpha(self.screen)
         self.notification_time = time.time()
+        self.dirty = True
     
-    def draw_error_and_notifications(self) -> None:
+    def update(self) -> None:
         """
-        Draw any active error messages or notifications.
+        Advance time-based UI state between frames.
+        
+        Drops error messages and notifications whose display time has run
+        out. The screen still shows their last faded frame, so it is marked
+        dirty to have them erased.
         """
         current_time = time.time()
+        if (self.error_message is not None
+                and current_time - self.error_time >= self.ERROR_DURATION):
+            self._clear_error()
+            self.dirty = True
+        if (self.notification_message is not None
+                and current_time - self.notification_time >= self.NOTIFICATION_DURATION):
+            self._clear_notification()
+            self.dirty = True
+    
+    def _clear_error(self) -> None:
+        """Drop the error message and release the surfaces drawn for it."""
+        self.error_message = None
+        self._error_surface = None
+        self._error_background = None
+    
+    def _clear_notification(self) -> None:
+        """Drop the notification and release the surface drawn for it."""
+        self.notification_message = None
+        self._notification_surface = None
+    
+    def needs_redraw(self) -> bool:
+        """
+        Check if the screen has to be redrawn even though the game state is unchanged.
+        
+        Messages fade out and highlights pulse, so they change every frame
+        while they are shown.
+        
+        Returns:
+            True if the next frame must be drawn, False if the screen is current
+        """
+        return (self.dirty or self._animating
+                or self.error_message is not None
+                or self.notification_message is not None)
+    
+    def draw_error_and_notifications(self) -> List[pygame.Rect]:
+        """
+        Draw any active error messages or notifications.
+        
+        Returns:
+            List of screen rectangles that were drawn to
+        """
+        current_time = self.frame_time
+        dirty = []
         
         # Draw error message if active
         if self.error_message:
-            # Error messages last for 3 seconds
-            if current_time - self.error_time < 3:
+            # Error messages last for ERROR_DURATION seconds
+            if current_time - self.error_time < self.ERROR_DURATION:
                 # Calculate alpha based on time remaining (fade out)
-                alpha = min(255, int(255 * (3 - (current_time - self.error_time)) / 1.5))
+                alpha = min(255, int(255 * (self.ERROR_DURATION - (current_time - self.error_time)) / 1.5))
                 
                 # Create text surface
-                error_surface = self.font.render(self.error_message, True, self.ERROR_COLOR)
+                error_surface = self._error_surface
                 
-                # Create background with alpha
-                bg_surface = pygame.Surface((error_surface.get_width() + 20, error_surface.get_height() + 10), pygame.SRCALPHA)
+                # Background with alpha
+                bg_surface = self._error_background
                 bg_surface.fill((0, 0, 0, alpha // 2))  # Semi-transparent black background
                 
                 # Position at bottom of screen
@@ -611,24 +1077,24 @@ class Renderer:
                 y = self.WINDOW_HEIGHT - bg_surface.get_height() - 20
                 
                 # Draw background and text
-                self.screen.blit(bg_surface, (x, y))
+                dirty.append(self.screen.blit(bg_surface, (x, y)))
                 
                 # Apply alpha to text surface
                 error_surface.set_alpha(alpha)
                 self.screen.blit(error_surface, (x + 10, y + 5))
             else:
                 # Clear error message after time expires
-                self.error_message = None
+                self._clear_error()
         
         # Draw notification if active
         if self.notification_message:
-            # Notifications last for 2 seconds
-            if current_time - self.notification_time < 2:
+            # Notifications last for NOTIFICATION_DURATION seconds
+            if current_time - self.notification_time < self.NOTIFICATION_DURATION:
                 # Calculate alpha based on time remaining (fade out)
-                alpha = min(255, int(255 * (2 - (current_time - self.notification_time)) / 1))
+                alpha = min(255, int(255 * (self.NOTIFICATION_DURATION - (current_time - self.notification_time)) / 1))
                 
                 # Create text surface
-                notification_surface = self.font.render(self.notification_message, True, self.NOTIFICATION_COLOR)
+                notification_surface = self._notification_surface
                 
                 # Position at top center of screen
                 x = (self.WINDOW_WIDTH - notification_surface.get_width()) // 2
@@ -636,55 +1102,85 @@ class Renderer:
                 
                 # Apply alpha to text surface
                 notification_surface.set_alpha(alpha)
-                self.screen.blit(notification_surface, (x, y))
+                dirty.append(self.screen.blit(notification_surface, (x, y)))
             else:
                 # Clear notification after time expires
-                self.notification_message = None
+                self._clear_notification()
+        
+        return dirty
     
-    def draw_enhanced_turn_indicator(self, game_state) -> None:
+    def draw_enhanced_turn_indicator(self, game_state) -> List[pygame.Rect]:
         """
         Draw an enhanced turn indicator showing the current player.
         
         Args:
             game_state: The current game state
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
         if game_state.is_game_over():
-            return
+            return []
             
         current_player = game_state.get_current_player()
         
-        # Create a rounded rectangle for the turn indicator
+        # The panel only changes with the current player, so it is one blit
+        # of a prebuilt surface
+        indicator = self._get_turn_indicator(current_player)
+        x = self.WINDOW_WIDTH - indicator.get_width() - 20
+        y = 20
+        indicator_rect = self.screen.blit(indicator, (x, y))
+        
+        return [indicator_rect]
+    
+    def _get_turn_indicator(self, player) -> pygame.Surface:
+        """
+        Get the turn indicator panel for a player, rendering it on first use.
+        
+        Args:
+            player: The player whose turn the panel shows
+            
+        Returns:
+            Surface with per-pixel alpha holding the panel, its border and text
+        """
+        surface = self._turn_indicators.get(player.player_id)
+        if surface is not None:
+            return surface
+        
+        # Create a rounded rectangle for the turn indicator; the corners
+        # outside it stay transparent
         indicator_width = 200
         indicator_height = 60
-        x = self.WINDOW_WIDTH - indicator_width - 20
-        y = 20
+        surface = pygame.Surface((indicator_width, indicator_height), pygame.SRCALPHA)
         
         # Draw background
         pygame.draw.rect(
-            self.screen,
+            surface,
             self.TURN_INDICATOR_BG,
-            (x, y, indicator_width, indicator_height),
+            (0, 0, indicator_width, indicator_height),
             border_radius=10
         )
         
-        # Draw colored border based on current player
+        # Draw colored border based on the player
         pygame.draw.rect(
-            self.screen,
-            current_player.color,
-            (x, y, indicator_width, indicator_height),
+            surface,
+            player.color,
+            (0, 0, indicator_width, indicator_height),
             width=3,
             border_radius=10
         )
         
         # Draw "Current Turn" text
-        turn_text = "Current Turn"
-        turn_surface = self.small_font.render(turn_text, True, self.TEXT_COLOR)
-        self.screen.blit(turn_surface, (x + 10, y + 5))
+        turn_surface = self._render_text(self.small_font, "Current Turn", self.TEXT_COLOR)
+        surface.blit(turn_surface, (10, 5))
         
         # Draw player text
-        player_text = f"Player {current_player.player_id}"
-        player_surface = self.large_font.render(player_text, True, current_player.color)
-        self.screen.blit(player_surface, (x + 10, y + 25))
+        player_text = f"Player {player.player_id}"
+        player_surface = self.large_font.render(player_text, True, player.color)
+        surface.blit(player_surface, (10, 25))
+        
+        surface = self._turn_indicators[player.player_id] = surface.convert_alpha(self.screen)
+        return surface
     
     def draw_enhanced_pawn_highlight(self, pawn) -> None:
         """
@@ -700,40 +1196,19 @@ class Renderer:
         if not position:
             return
             
-        x, y = position
-        screen_x = self.board_x + x * self.cell_size
-        screen_y = self.board_y + y * self.cell_size
+        screen_x, screen_y = self._intersection_pixels[position]
         
         # Create pulsing effect
-        pulse_factor = (pygame.time.get_ticks() % 1000) / 1000  # 0 to 1 over 1 second
+        pulse_factor = self._pulse_1000  # 0 to 1 over 1 second
         pulse_radius = self.HIGHLIGHT_RADIUS + 2 * abs(pulse_factor - 0.5)  # Pulse between sizes
         
-        # Draw outer glow (semi-transparent)
-        glow_surface = pygame.Surface((int(pulse_radius * 2.5), int(pulse_radius * 2.5)), pygame.SRCALPHA)
-        for i in range(3):
-            size = int(pulse_radius * (1 + i * 0.2))
-            alpha = 100 - i * 30
-            pygame.draw.circle(
-                glow_surface,
-                self.HIGHLIGHT_COLOR + (alpha,),
-                (int(pulse_radius * 1.25), int(pulse_radius * 1.25)),
-                size,
-                2
-            )
+        # Outer glow (semi-transparent) with the solid highlight circle
+        glow_surface = self._get_glow_sprite(pulse_radius)
         
         # Position and draw the glow
         glow_x = screen_x - int(pulse_radius * 1.25)
         glow_y = screen_y - int(pulse_radius * 1.25)
         self.screen.blit(glow_surface, (glow_x, glow_y))
-        
-        # Draw solid highlight circle
-        pygame.draw.circle(
-            self.screen,
-            self.HIGHLIGHT_COLOR,
-            (screen_x, screen_y),
-            self.HIGHLIGHT_RADIUS,
-            2
-        )
     
     def draw_enhanced_valid_moves(self, valid_moves: List[Tuple[int, int]]) -> None:
         """
@@ -742,106 +1217,161 @@ class Renderer:
         Args:
             valid_moves: List of (x, y) coordinates representing valid moves
         """
-        pulse_factor = (pygame.time.get_ticks() % 1500) / 1500  # 0 to 1 over 1.5 seconds
-        
-        for x, y in valid_moves:
-            screen_x = self.board_x + x * self.cell_size
-            screen_y = self.board_y + y * self.cell_size
-            
-            # Create a pulsing effect for valid moves
-            pulse_size = self.VALID_MOVE_RADIUS + pulse_factor * 3
-            
-            # Draw filled circle with transparency
-            s = pygame.Surface((int(pulse_size * 2), int(pulse_size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                s,
-                self.VALID_MOVE_COLOR + (100,),  # Semi-transparent green
-                (int(pulse_size), int(pulse_size)),
-                int(pulse_size)
-            )
-            self.screen.blit(s, (screen_x - int(pulse_size), screen_y - int(pulse_size)))
-            
-            # Draw outline
-            pygame.draw.circle(
-                self.screen,
-                self.VALID_MOVE_COLOR,
-                (screen_x, screen_y),
-                self.VALID_MOVE_RADIUS,
-                2
-            )
+        pulse_factor = self._pulse_1500  # 0 to 1 over 1.5 seconds
+        
+        # Create a pulsing effect for valid moves; the fill only takes a few
+        # whole-pixel radii, so both circles come from the sprite cache
+        pulse_size = self.VALID_MOVE_RADIUS + pulse_factor * 3
+        fill_radius = int(pulse_size)
+        fill = self._get_circle_sprite(self.VALID_MOVE_COLOR_A100, fill_radius)  # Semi-transparent green
+        outline_radius = self.VALID_MOVE_RADIUS
+        outline = self._get_circle_sprite(self.VALID_MOVE_COLOR, outline_radius, 2)
+        
+        # Draw every fill, then every outline, in one call. Markers are a
+        # cell apart and never overlap, so the order between moves does not
+        # matter and each loop is only the corner subtraction
+        intersection_pixels = self._intersection_pixels
+        centers = [intersection_pixels[position] for position in valid_moves]
+        sprites = [(fill, (x - fill_radius, y - fill_radius)) for x, y in centers]
+        sprites += [(outline, (x - outline_radius, y - outline_radius)) for x, y in centers]
+        self.screen.blits(sprites, False)
     
-    def draw_escaped_pawns_counter(self, game_state) -> None:
+    def draw_escaped_pawns_counter(self, game_state) -> List[pygame.Rect]:
         """
         Draw counters showing how many pawns each player has escaped.
         
         Args:
             game_state: The current game state
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
-        # Position for the counters
-        counter_x = self.WINDOW_WIDTH - 220
-        counter_y = 100
-        spacing = 30
-        
-        # Draw header
-        header_text = "Escaped Pawns"
-        header_surface = self.font.render(header_text, True, self.TEXT_COLOR)
-        self.screen.blit(header_surface, (counter_x, counter_y))
+        # The counter only changes when a pawn escapes, so the three lines
+        # are composited into one panel that is rebuilt only then. The counts
+        # are only read again once the game state has changed at all
+        token = game_state.state_token
+        if token != self._counter_token:
+            counts = (game_state.players[0].escaped_pawn_count,
+                      game_state.players[1].escaped_pawn_count)
+            if counts != self._counter_counts:
+                self._counter_panel = self._build_counter_panel(counts, self._counter_spacing)
+                self._counter_counts = counts
+            self._counter_token = token
+        
+        # The board is drawn over part of the counter every frame, so the
+        # panel is still copied even when it is unchanged
+        return [self.screen.blit(self._counter_panel, self._counter_pos)]
+    
+    def _build_counter_panel(self, counts: Tuple[int, int], spacing: int) -> pygame.Surface:
+        """
+        Render the escaped pawns counter for the given escape counts.
         
-        # Draw player 1 escaped pawns
-        player1 = game_state.players[0]
-        escaped_pawns1 = len(player1.get_escaped_pawns())
-        player1_text = f"Player 1: {escaped_pawns1}/7"
-        player1_surface = self.font.render(player1_text, True, player1.color)
-        self.screen.blit(player1_surface, (counter_x, counter_y + spacing))
+        The board's edge and pawns on its last column can sit under the
+        counter, so the panel stays transparent around the text. The lines
+        are copied into it unblended (a max against transparent black is an
+        exact copy), so blitting the panel blends each pixel exactly as
+        blitting the lines themselves did.
         
-        # Draw player 2 escaped pawns
-        player2 = game_state.players[1]
-        escaped_pawns2 = len(player2.get_escaped_pawns())
-        player2_text = f"Player 2: {escaped_pawns2}/7"
-        player2_surface = self.font.render(player2_text, True, player2.color)
-        self.screen.blit(player2_surface, (counter_x, counter_y + spacing * 2))
+        Args:
+            counts: Escaped pawns of player 1 and player 2
+            spacing: Vertical distance between the counter's lines
+            
+        Returns:
+            Surface with per-pixel alpha holding the header and both player
+            lines
+        """
+        # Header
+        header_text = "Escaped Pawns"
+        header_surface = self._render_text(self.font, header_text, self.TEXT_COLOR)
+        
+        # Player 1 and player 2 escaped pawns
+        player1_surface = self._counter_labels[1][counts[0]]
+        player2_surface = self._counter_labels[2][counts[1]]
+        
+        width = max(header_surface.get_width(), player1_surface.get_width(),
+                    player2_surface.get_width())
+        height = spacing * 2 + player2_surface.get_height()
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.blits((
+            (header_surface, (0, 0), None, pygame.BLEND_RGBA_MAX),
+            (player1_surface, (0, spacing), None, pygame.BLEND_RGBA_MAX),
+            (player2_surface, (0, spacing * 2), None, pygame.BLEND_RGBA_MAX),
+        ), False)
+        return panel.convert_alpha(self.screen)
     
-    def draw_turn_skipped_notification(self, skipped_player_id: int) -> None:
+    def draw_turn_skipped_notification(self, skipped_player_id: int) -> List[pygame.Rect]:
         """
         Draw a notification when a player's turn is skipped due to no valid moves.
         
         Args:
             skipped_player_id: The ID of the player whose turn was skipped
+            
+        Returns:
+            List of screen rectangles that were drawn to
         """
         if not skipped_player_id:
-            return
+            return []
             
-        # Create a notification panel
-        panel_width = 300
-        panel_height = 60
-        panel_x = (self.WINDOW_WIDTH - panel_width) // 2
-        panel_y = self.WINDOW_HEIGHT - panel_height - 40
+        # Panel and text only depend on the player, so the whole
+        # notification is prebuilt per player and drawn in one call
+        self.screen.blits(self._get_skip_notification(skipped_player_id), False)
+        return [self._skip_panel_rect.copy()]
+    
+    def _get_skip_notification(self, skipped_player_id: int
+                               ) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+        """
+        Get the turn skipped notification for a player, building it on first use.
+        
+        The panel background and its border in the player's color are
+        composited into one surface. The text is kept separate: blending it
+        into the translucent panel first would not give the same pixels as
+        blending it onto the screen over the panel.
+        
+        Args:
+            skipped_player_id: The ID of the player whose turn was skipped
+            
+        Returns:
+            (surface, position) pairs for the panel and its two text lines,
+            in drawing order
+        """
+        notification = self._skip_notifications.get(skipped_player_id)
+        if notification is not None:
+            return notification
+        
+        # Notification panel; its layout is fixed, see __init__
+        panel_rect = self._skip_panel_rect
         
         # Get player color based on ID
         player_color = self.PLAYER1_COLOR if skipped_player_id == 1 else self.PLAYER2_COLOR
         
-        # Draw panel with semi-transparency
-        s = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        s.fill((50, 50, 50, 180))  # Semi-transparent dark background
-        self.screen.blit(s, (panel_x, panel_y))
+        # Panel with semi-transparency
+        panel = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+        panel.fill((50, 50, 50, 180))  # Semi-transparent dark background
         
-        # Draw border with player color
+        # Border with player color; it is opaque, so drawing it here gives
+        # the same pixels as drawing it over the panel on the screen
         pygame.draw.rect(
-            self.screen,
+            panel,
             player_color,
-            (panel_x, panel_y, panel_width, panel_height),
+            panel.get_rect(),
             width=2,
             border_radius=5
         )
         
-        # Draw skip notification text
+        # Skip notification text
         skip_text = f"Player {skipped_player_id}'s turn skipped"
-        skip_surface = self.font.render(skip_text, True, (255, 255, 255))
-        skip_rect = skip_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 20))
-        self.screen.blit(skip_surface, skip_rect)
+        skip_surface = self._render_text(self.font, skip_text, (255, 255, 255))
+        skip_rect = skip_surface.get_rect(center=self._skip_text_center)
         
-        # Draw reason text
+        # Reason text
         reason_text = "No valid moves available"
-        reason_surface = self.small_font.render(reason_text, True, (200, 200, 200))
-        reason_rect = reason_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 40))
-        self.screen.blit(reason_surface, reason_rect)
\ No newline at end of file
+        reason_surface = self._render_text(self.small_font, reason_text, (200, 200, 200))
+        reason_rect = reason_surface.get_rect(center=self._skip_reason_center)
+        
+        notification = (
+            (panel.convert_alpha(self.screen), panel_rect.topleft),
+            (skip_surface, skip_rect.topleft),
+            (reason_surface, reason_rect.topleft),
+        )
+        self._skip_notifications[skipped_player_id] = notification
+        return notification
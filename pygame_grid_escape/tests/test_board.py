@@ -5,49 +5,94 @@ import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from game_logic.board import Board
 from game_logic.player import Player
 from game_logic.pawn import Pawn
 
 
+# Every intersection of the grid, and coordinates just off it in every direction
+GRID_SIZE = Board.GRID_SIZE
+VALID_POSITIONS = tuple((x, y) for x in range(GRID_SIZE) for y in range(GRID_SIZE))
+INVALID_POSITIONS = ((-1, 0), (0, -1), (GRID_SIZE, 0), (0, GRID_SIZE),
+                     (-1, -1), (GRID_SIZE, GRID_SIZE))
+
+# Last row and column of the grid; starting and escape positions use only
+# the center points of an edge, leaving out both corners
+LAST = GRID_SIZE - 1
+CENTER = range(1, LAST)
+
+
+def grid_of(check):
+    """
+    Evaluate a check at every intersection of the grid.
+    
+    Args:
+        check: Function taking x and y
+        
+    Returns:
+        List of rows (by y) of the results for each column (by x), so whole
+        grids can be compared with one assertEqual
+    """
+    return [[check(x, y) for x in range(GRID_SIZE)] for y in range(GRID_SIZE)]
+
+# Expected neighbors of each position the adjacency tests check, built
+# once as order-independent sets
+ADJACENT_EXPECTED = {
+    (2, 2): frozenset({(2, 1), (2, 3), (1, 2), (3, 2)}),  # Up, Down, Left, Right
+    (0, 0): frozenset({(0, 1), (1, 0)}),                  # Down, Right
+    (4, 4): frozenset({(4, 3), (3, 4)}),                  # Up, Left
+    (4, 0): frozenset({(4, 1), (3, 0)}),                  # Down, Left
+    (0, 4): frozenset({(0, 3), (1, 4)}),                  # Up, Right
+    (2, 0): frozenset({(2, 1), (1, 0), (3, 0)}),          # Down, Left, Right
+    (2, 4): frozenset({(2, 3), (1, 4), (3, 4)}),          # Up, Left, Right
+    (0, 2): frozenset({(0, 1), (0, 3), (1, 2)}),          # Up, Down, Right
+    (4, 2): frozenset({(4, 1), (4, 3), (3, 2)}),          # Up, Down, Left
+}
+
+
 class TestBoard(unittest.TestCase):
     """Test cases for the Board class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up the players and pawns shared by every test method."""
+        # Placing pawns on a board does not change the pawns or players,
+        # so they are built once for the whole class
+        cls.player1 = Player(1, (0, 102, 204))  # Blue
+        cls.player2 = Player(2, (204, 0, 0))    # Red
+        cls.pawn1 = cls.player1.get_pawns()[0]
+        cls.pawn2 = cls.player2.get_pawns()[0]
+    
     def setUp(self):
-        """Set up test fixtures before each test method."""
+        """Set up a fresh board before each test method."""
         self.board = Board()
-        self.player1 = Player(1, (0, 102, 204))  # Blue
-        self.player2 = Player(2, (204, 0, 0))    # Red
-        self.pawn1 = self.player1.get_pawns()[0]
-        self.pawn2 = self.player2.get_pawns()[0]
     
     def test_board_initialization(self):
         """Test that the board initializes correctly."""
-        self.assertEqual(self.board.get_grid_size(), 5)
-        
-        # Check that all intersections are initially empty
-        for x in range(5):
-            for y in range(5):
-                self.assertTrue(self.board.is_intersection_empty(x, y))
-                self.assertIsNone(self.board.get_pawn_at_intersection(x, y))
+        self.assertEqual(self.board.get_grid_size(), 7)
+        
+        # Check that all intersections are initially empty, comparing the
+        # whole grid at once (rows by y, columns by x)
+        self.assertEqual(grid_of(self.board.is_intersection_empty),
+                         [[True] * GRID_SIZE] * GRID_SIZE)
+        self.assertEqual(grid_of(self.board.get_pawn_at_intersection),
+                         [[None] * GRID_SIZE] * GRID_SIZE)
     
     def test_is_valid_position(self):
         """Test position validation."""
-        # Valid positions
-        self.assertTrue(self.board.is_valid_position(0, 0))
-        self.assertTrue(self.board.is_valid_position(4, 4))
-        self.assertTrue(self.board.is_valid_position(2, 3))
+        # Valid positions: every intersection of the grid
+        self.assertTrue(all(self.board.is_valid_position(x, y)
+                            for x, y in VALID_POSITIONS))
         
         # Invalid positions
-        self.assertFalse(self.board.is_valid_position(-1, 0))
-        self.assertFalse(self.board.is_valid_position(0, -1))
-        self.assertFalse(self.board.is_valid_position(5, 0))
-        self.assertFalse(self.board.is_valid_position(0, 5))
-        self.assertFalse(self.board.is_valid_position(-1, -1))
-        self.assertFalse(self.board.is_valid_position(5, 5))
+        self.assertFalse(any(self.board.is_valid_position(x, y)
+                             for x, y in INVALID_POSITIONS))
     
     def test_pawn_placement_and_removal(self):
         """Test placing and removing pawns."""
@@ -99,66 +144,50 @@ class TestBoard(unittest.TestCase):
     
     def test_starting_positions_player1(self):
         """Test starting position identification for Player 1."""
-        # Player 1 starts on bottom row (y = 4)
-        for x in range(5):
-            self.assertTrue(self.board.is_starting_position(x, 4, self.player1))
-        
-        # Other positions should not be starting positions for Player 1
-        for y in range(4):  # y = 0, 1, 2, 3
-            for x in range(5):
-                self.assertFalse(self.board.is_starting_position(x, y, self.player1))
+        # Player 1 starts on the center points of the bottom row (y = 6);
+        # other positions should not be starting positions for Player 1
+        starting = grid_of(lambda x, y: self.board.is_starting_position(x, y, self.player1))
+        self.assertEqual(starting, grid_of(lambda x, y: y == LAST and x in CENTER))
         
         # Test get_all_starting_positions
         starting_positions = self.board.get_all_starting_positions(self.player1)
-        expected_positions = [(x, 4) for x in range(5)]
+        expected_positions = [(x, LAST) for x in CENTER]
         self.assertEqual(set(starting_positions), set(expected_positions))
     
     def test_starting_positions_player2(self):
         """Test starting position identification for Player 2."""
-        # Player 2 starts on top row (y = 0)
-        for x in range(5):
-            self.assertTrue(self.board.is_starting_position(x, 0, self.player2))
-        
-        # Other positions should not be starting positions for Player 2
-        for y in range(1, 5):  # y = 1, 2, 3, 4
-            for x in range(5):
-                self.assertFalse(self.board.is_starting_position(x, y, self.player2))
+        # Player 2 starts on the center points of the right column (x = 6);
+        # other positions should not be starting positions for Player 2
+        starting = grid_of(lambda x, y: self.board.is_starting_position(x, y, self.player2))
+        self.assertEqual(starting, grid_of(lambda x, y: x == LAST and y in CENTER))
         
         # Test get_all_starting_positions
         starting_positions = self.board.get_all_starting_positions(self.player2)
-        expected_positions = [(x, 0) for x in range(5)]
+        expected_positions = [(LAST, y) for y in CENTER]
         self.assertEqual(set(starting_positions), set(expected_positions))
     
     def test_escape_positions_player1(self):
         """Test escape position identification for Player 1."""
-        # Player 1 escapes from top row (y = 0)
-        for x in range(5):
-            self.assertTrue(self.board.is_escape_position(x, 0, self.player1))
-        
-        # Other positions should not be escape positions for Player 1
-        for y in range(1, 5):  # y = 1, 2, 3, 4
-            for x in range(5):
-                self.assertFalse(self.board.is_escape_position(x, y, self.player1))
+        # Player 1 escapes from the center points of the top row (y = 0);
+        # other positions should not be escape positions for Player 1
+        escape = grid_of(lambda x, y: self.board.is_escape_position(x, y, self.player1))
+        self.assertEqual(escape, grid_of(lambda x, y: y == 0 and x in CENTER))
         
         # Test get_all_escape_positions
         escape_positions = self.board.get_all_escape_positions(self.player1)
-        expected_positions = [(x, 0) for x in range(5)]
+        expected_positions = [(x, 0) for x in CENTER]
         self.assertEqual(set(escape_positions), set(expected_positions))
     
     def test_escape_positions_player2(self):
         """Test escape position identification for Player 2."""
-        # Player 2 escapes from bottom row (y = 4)
-        for x in range(5):
-            self.assertTrue(self.board.is_escape_position(x, 4, self.player2))
-        
-        # Other positions should not be escape positions for Player 2
-        for y in range(4):  # y = 0, 1, 2, 3
-            for x in range(5):
-                self.assertFalse(self.board.is_escape_position(x, y, self.player2))
+        # Player 2 escapes from the center points of the left column (x = 0);
+        # other positions should not be escape positions for Player 2
+        escape = grid_of(lambda x, y: self.board.is_escape_position(x, y, self.player2))
+        self.assertEqual(escape, grid_of(lambda x, y: x == 0 and y in CENTER))
         
         # Test get_all_escape_positions
         escape_positions = self.board.get_all_escape_positions(self.player2)
-        expected_positions = [(x, 4) for x in range(5)]
+        expected_positions = [(0, y) for y in CENTER]
         self.assertEqual(set(escape_positions), set(expected_positions))
     
     def test_starting_escape_positions_invalid_positions(self):
@@ -178,69 +207,60 @@ class TestBoard(unittest.TestCase):
         """Test adjacency calculation for center positions."""
         # Test center position (2, 2)
         adjacent = self.board.get_adjacent_intersections(2, 2)
-        expected = [(2, 1), (2, 3), (1, 2), (3, 2)]  # Up, Down, Left, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(2, 2)])
         self.assertEqual(len(adjacent), 4)
     
     def test_adjacent_intersections_corner(self):
         """Test adjacency calculation for corner positions."""
         # Test top-left corner (0, 0)
         adjacent = self.board.get_adjacent_intersections(0, 0)
-        expected = [(0, 1), (1, 0)]  # Down, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(0, 0)])
         self.assertEqual(len(adjacent), 2)
         
         # Test bottom-right corner (4, 4)
         adjacent = self.board.get_adjacent_intersections(4, 4)
-        expected = [(4, 3), (3, 4)]  # Up, Left
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(4, 4)])
         self.assertEqual(len(adjacent), 2)
         
         # Test top-right corner (4, 0)
         adjacent = self.board.get_adjacent_intersections(4, 0)
-        expected = [(4, 1), (3, 0)]  # Down, Left
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(4, 0)])
         self.assertEqual(len(adjacent), 2)
         
         # Test bottom-left corner (0, 4)
         adjacent = self.board.get_adjacent_intersections(0, 4)
-        expected = [(0, 3), (1, 4)]  # Up, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(0, 4)])
         self.assertEqual(len(adjacent), 2)
     
     def test_adjacent_intersections_edge(self):
         """Test adjacency calculation for edge positions."""
         # Test top edge (2, 0)
         adjacent = self.board.get_adjacent_intersections(2, 0)
-        expected = [(2, 1), (1, 0), (3, 0)]  # Down, Left, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(2, 0)])
         self.assertEqual(len(adjacent), 3)
         
         # Test bottom edge (2, 4)
         adjacent = self.board.get_adjacent_intersections(2, 4)
-        expected = [(2, 3), (1, 4), (3, 4)]  # Up, Left, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(2, 4)])
         self.assertEqual(len(adjacent), 3)
         
         # Test left edge (0, 2)
         adjacent = self.board.get_adjacent_intersections(0, 2)
-        expected = [(0, 1), (0, 3), (1, 2)]  # Up, Down, Right
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(0, 2)])
         self.assertEqual(len(adjacent), 3)
         
         # Test right edge (4, 2)
         adjacent = self.board.get_adjacent_intersections(4, 2)
-        expected = [(4, 1), (4, 3), (3, 2)]  # Up, Down, Left
-        self.assertEqual(set(adjacent), set(expected))
+        self.assertEqual(frozenset(adjacent), ADJACENT_EXPECTED[(4, 2)])
         self.assertEqual(len(adjacent), 3)
     
     def test_adjacent_intersections_invalid_position(self):
         """Test adjacency calculation for invalid positions."""
         # Invalid positions should return empty list
-        self.assertEqual(self.board.get_adjacent_intersections(-1, 0), [])
-        self.assertEqual(self.board.get_adjacent_intersections(0, -1), [])
-        self.assertEqual(self.board.get_adjacent_intersections(5, 0), [])
-        self.assertEqual(self.board.get_adjacent_intersections(0, 5), [])
+        self.assertEqual(self.board.get_adjacent_intersections(-1, 0), ())
+        self.assertEqual(self.board.get_adjacent_intersections(0, -1), ())
+        self.assertEqual(self.board.get_adjacent_intersections(5, 0), ())
+        self.assertEqual(self.board.get_adjacent_intersections(0, 5), ())
     
     def test_valid_moves_from_position(self):
         """Test getting valid moves from a position."""
@@ -296,6 +316,47 @@ class TestBoard(unittest.TestCase):
                 self.assertTrue(self.board.is_intersection_empty(x, y))
                 self.assertIsNone(self.board.get_pawn_at_intersection(x, y))
 
+    
+    def test_forward_move_mask(self):
+        """Test that the forward move mask only allows one empty step forward."""
+        cell = self.board.cell_index(3, 3)
+        
+        # Player 1 moves up, Player 2 moves left
+        mask1 = self.board.get_forward_move_mask(cell, self.player1)
+        self.assertEqual(mask1, 1 << self.board.cell_index(3, 2))
+        mask2 = self.board.get_forward_move_mask(cell, self.player2)
+        self.assertEqual(mask2, 1 << self.board.cell_index(2, 3))
+        
+        # A blocked forward cell gives an empty mask
+        self.assertTrue(self.board.place_pawn(self.pawn2, 3, 2))
+        self.assertEqual(self.board.get_forward_move_mask(cell, self.player1), 0)
+        
+        # Pawns on the edge cannot step off the board
+        edge_cell = self.board.cell_index(0, 0)
+        self.assertEqual(self.board.get_forward_move_mask(edge_cell, self.player1), 0)
+        self.assertEqual(self.board.get_forward_move_mask(edge_cell, self.player2), 0)
+    
+    def test_is_escape_cell_matches_escape_positions(self):
+        """Test that the cell-index escape check agrees with is_escape_position."""
+        for x in range(self.board.GRID_SIZE):
+            for y in range(self.board.GRID_SIZE):
+                cell = self.board.cell_index(x, y)
+                for player in (self.player1, self.player2):
+                    self.assertEqual(self.board.is_escape_cell(cell, player),
+                                     self.board.is_escape_position(x, y, player))
+    
+    def test_get_legal_moves(self):
+        """Test enumerating every legal move for a player at once."""
+        pawn_a, pawn_b = self.player1.get_pawns()[:2]
+        self.assertTrue(self.board.place_pawn(pawn_a, 1, 3))
+        self.assertTrue(self.board.place_pawn(pawn_b, 1, 2))
+        
+        # The lower pawn is blocked by the upper one
+        self.assertEqual(self.board.get_legal_moves(self.player1), [((1, 2), (1, 1))])
+        self.assertEqual(self.board.get_legal_moves(self.player2), [])
+        self.assertEqual(self.board.count_legal_moves(self.player1), 1)
+        self.assertEqual(self.board.count_legal_moves(self.player2), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -14,8 +14,11 @@ os.environ['SDL_VIDEODRIVER'] = 'dummy'
 
 import pygame
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from game_logic.game_state import GameState
 from game_logic.board import Board
@@ -5,8 +5,11 @@ import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from game_logic.game_state import GameState
 from game_logic.player import Player
@@ -118,52 +121,6 @@ class TestGameState(unittest.TestCase):
         self.assertTrue(self.game_state.is_game_over())
         self.assertFalse(self.game_state.is_movement_phase())
     
-    def test_transition_to_playing_phase(self):
-        """Test transitioning from setup to playing phase."""
-        # Should fail if not in setup phase
-        self.game_state.phase = GameState.PLAYING
-        self.assertFalse(self.game_state.transition_to_playing_phase())
-        
-        # Reset to setup phase
-        self.game_state.phase = GameState.SETUP
-        
-        # Should fail if pawns are not all placed
-        self.assertFalse(self.game_state.transition_to_playing_phase())
-        
-        # Place all pawns (simulate by marking them as escaped to reduce unplaced count)
-        for player in self.game_state.players:
-            for pawn in player.get_pawns():
-                pawn._escaped = True
-        
-        # Now transition should succeed
-        self.assertTrue(self.game_state.transition_to_playing_phase())
-        self.assertTrue(self.game_state.is_movement_phase())
-        self.assertEqual(self.game_state.current_player_index, 0)  # Player 1 starts
-    
-    def test_is_setup_complete(self):
-        """Test setup completion detection."""
-        # Initially setup is not complete (all pawns unplaced)
-        self.assertFalse(self.game_state.is_setup_complete())
-        
-        # Place some pawns for player 1
-        player1 = self.game_state.players[0]
-        for i, pawn in enumerate(player1.get_pawns()[:3]):
-            pawn.set_position(i, 4)  # Place on bottom row
-        
-        # Still not complete
-        self.assertFalse(self.game_state.is_setup_complete())
-        
-        # Place all pawns for both players
-        for player in self.game_state.players:
-            for i, pawn in enumerate(player.get_pawns()):
-                if player.player_id == 1:
-                    pawn.set_position(i % 5, 4)  # Bottom row for player 1
-                else:
-                    pawn.set_position(i % 5, 0)  # Top row for player 2
-        
-        # Now setup should be complete
-        self.assertTrue(self.game_state.is_setup_complete())
-    
     def test_check_victory(self):
         """Test victory condition checking."""
         # Initially no winner
@@ -470,6 +427,46 @@ class TestGameState(unittest.TestCase):
         self.assertFalse(pawn.is_on_board())
         self.assertFalse(pawn.is_escaped())
         self.assertTrue(self.game_state.board.is_intersection_empty(0, 4))
+    
+    def test_dirty_flag_tracks_visible_changes(self):
+        """Test that selection and successful actions mark the state as dirty."""
+        self.assertTrue(self.game_state.dirty)
+        self.game_state.dirty = False
+        
+        # A failed placement changes nothing on screen
+        player2_pawn = self.game_state.players[1].get_pawns()[0]
+        self.assertFalse(self.game_state.place_pawn(player2_pawn, 6, 1))
+        self.assertFalse(self.game_state.dirty)
+        
+        pawn = self.game_state.players[0].get_pawns()[0]
+        self.assertTrue(self.game_state.place_pawn(pawn, 1, 6))
+        self.assertTrue(self.game_state.dirty)
+        
+        self.game_state.dirty = False
+        self.game_state.selected_pawn = pawn
+        self.assertTrue(self.game_state.dirty)
+        self.assertIs(self.game_state.selected_pawn, pawn)
+    
+    def test_state_token_changes_with_game_state(self):
+        """Test that placements, turn switches and resets change the state token."""
+        token = self.game_state.state_token
+        
+        # A failed placement leaves the token as it was
+        player2_pawn = self.game_state.players[1].get_pawns()[0]
+        self.assertFalse(self.game_state.place_pawn(player2_pawn, 6, 1))
+        self.assertEqual(self.game_state.state_token, token)
+        
+        pawn = self.game_state.players[0].get_pawns()[0]
+        self.assertTrue(self.game_state.place_pawn(pawn, 1, 6))
+        self.assertNotEqual(self.game_state.state_token, token)
+        
+        token = self.game_state.state_token
+        self.game_state.switch_turn()
+        self.assertNotEqual(self.game_state.state_token, token)
+        
+        token = self.game_state.state_token
+        self.game_state.reset_game()
+        self.assertNotEqual(self.game_state.state_token, token)
 
 
 if __name__ == '__main__':
@@ -9,8 +9,11 @@ import os
 # Mock pygame module
 sys.modules['pygame'] = Mock()
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from input.input_handler import InputHandler
 
@@ -222,6 +225,38 @@ class TestInputHandler(unittest.TestCase):
         
         self.assertFalse(result)
     
+    def test_handle_click_game_over_restart(self):
+        """Test that clicking the restart area on the game over screen restarts the game."""
+        self.renderer.pixel_to_grid_position.return_value = None
+        self.game_state.is_game_over.return_value = True
+        
+        # The restart text sits 40 pixels below the window center
+        result = self.input_handler.handle_click((400, 340), self.game_state, self.renderer)
+        
+        self.assertTrue(result)
+        self.game_state.reset_game.assert_called_once_with()
+    
+    def test_handle_keys_coalesces_frame(self):
+        """Test that one restart covers every R and ESC pressed in a frame."""
+        # Key codes as seen by the input handler module
+        pygame = sys.modules[InputHandler.__module__].pygame
+        self.game_state.selected_pawn = self.mock_pawn
+        
+        self.input_handler.handle_keys([pygame.K_ESCAPE, pygame.K_r, pygame.K_r],
+                                       self.game_state, self.renderer)
+        
+        self.game_state.reset_game.assert_called_once_with()
+        self.renderer.show_notification.assert_called_once_with("Game restarted")
+        
+        # Without a restart, repeated ESC presses deselect once
+        self.game_state.selected_pawn = self.mock_pawn
+        self.renderer.show_notification.reset_mock()
+        self.input_handler.handle_keys([pygame.K_ESCAPE, pygame.K_ESCAPE],
+                                       self.game_state, self.renderer)
+        
+        self.assertIsNone(self.game_state.selected_pawn)
+        self.renderer.show_notification.assert_called_once_with("Pawn deselected")
+    
     def test_get_intersection_from_pixel(self):
         """Test get_intersection_from_pixel method."""
         # Mock renderer to return grid position
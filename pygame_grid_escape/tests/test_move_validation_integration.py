@@ -8,8 +8,11 @@ import unittest
 import sys
 import os
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from game_logic.board import Board
 from game_logic.player import Player
@@ -452,6 +455,23 @@ class TestMoveValidationIntegration(unittest.TestCase):
         
         # Player 2 should be able to move
         self.assertTrue(player2.can_move_any_pawn(game_state.board))
+    
+    def test_valid_moves_mask_matches_can_move_to(self):
+        """Test that the valid moves mask agrees with can_move_to."""
+        self.board.place_pawn(self.pawn1, 3, 3)
+        self.pawn1.set_position(3, 3)
+        
+        mask = self.pawn1.get_valid_moves_mask(self.board)
+        self.assertEqual(mask, 1 << self.board.cell_index(3, 2))
+        self.assertTrue(self.pawn1.can_move_to(self.board, 3, 2))
+        self.assertFalse(self.pawn1.can_move_to(self.board, 3, 4))
+        self.assertFalse(self.pawn1.can_move_to(self.board, 3, -1))
+        
+        # Blocking the forward cell clears the mask
+        self.board.place_pawn(self.pawn2, 3, 2)
+        self.pawn2.set_position(3, 2)
+        self.assertEqual(self.pawn1.get_valid_moves_mask(self.board), 0)
+        self.assertFalse(self.pawn1.can_move_to(self.board, 3, 2))
 
 
 if __name__ == '__main__':
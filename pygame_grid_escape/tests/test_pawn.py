@@ -6,9 +6,13 @@ import sys
 import os
 from unittest.mock import Mock
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
+from game_logic.board import Board
 from game_logic.pawn import Pawn
 
 
@@ -21,6 +25,24 @@ class TestPawn(unittest.TestCase):
         self.mock_player.player_id = 1
         self.pawn = Pawn(self.mock_player, 0)
     
+    def _stub_valid_moves(self, mock_board, moves):
+        """
+        Make a mock board report the given positions as the pawn's valid moves.
+        
+        Pawns read their valid moves from the board's forward move mask, so
+        the mock answers with a mask holding the cell of each position and
+        encodes positions the way the real board does.
+        
+        Args:
+            mock_board: The mock board to set up
+            moves: (x, y) positions to report as valid moves
+        """
+        board = Board()
+        mock_board.cell_index.side_effect = board.cell_index
+        mock_board.is_valid_position.side_effect = board.is_valid_position
+        mock_board.get_forward_move_mask.return_value = sum(
+            1 << board.cell_index(x, y) for x, y in moves)
+    
     def test_pawn_initialization(self):
         """Test that a pawn is properly initialized."""
         self.assertEqual(self.pawn.player, self.mock_player)
@@ -92,21 +114,22 @@ class TestPawn(unittest.TestCase):
         self.assertEqual(self.pawn.get_valid_moves(mock_board), [])
     
     def test_get_valid_moves_with_board(self):
-        """Test that get_valid_moves uses board's get_valid_moves_from_position method."""
+        """Test that get_valid_moves expands the board's forward move mask."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2)]
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2)])
         
         self.pawn.set_position(2, 2)
         valid_moves = self.pawn.get_valid_moves(mock_board)
         
-        # Should call board's method with pawn's position
-        mock_board.get_valid_moves_from_position.assert_called_once_with(2, 2)
+        # Should call board's method with pawn's cell
+        mock_board.get_forward_move_mask.assert_called_once_with(
+            self.pawn.get_cell(), self.mock_player)
         self.assertEqual(valid_moves, [(1, 2), (3, 2)])
     
     def test_can_move_to_valid_position(self):
         """Test can_move_to method with valid positions."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2), (2, 1), (2, 3)]
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2), (2, 1), (2, 3)])
         
         self.pawn.set_position(2, 2)
         
@@ -135,7 +158,7 @@ class TestPawn(unittest.TestCase):
     def test_move_to_valid_position(self):
         """Test move_to method with valid move."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2)]
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2)])
         mock_board.move_pawn.return_value = True
         mock_board.is_escape_position.return_value = False
         
@@ -157,7 +180,7 @@ class TestPawn(unittest.TestCase):
     def test_move_to_invalid_position(self):
         """Test move_to method with invalid move."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2)]
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2)])
         
         self.pawn.set_position(2, 2)
         original_position = self.pawn.get_position()
@@ -175,7 +198,7 @@ class TestPawn(unittest.TestCase):
     def test_move_to_board_move_fails(self):
         """Test move_to when board.move_pawn fails."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2)]
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2)])
         mock_board.move_pawn.return_value = False  # Board move fails
         
         self.pawn.set_position(2, 2)
@@ -194,7 +217,7 @@ class TestPawn(unittest.TestCase):
     def test_move_to_escape_position(self):
         """Test move_to method when moving to escape position."""
         mock_board = Mock()
-        mock_board.get_valid_moves_from_position.return_value = [(2, 0)]  # Escape position
+        self._stub_valid_moves(mock_board, [(2, 0)])  # Escape position
         mock_board.move_pawn.return_value = True
         mock_board.is_escape_position.return_value = True  # This is an escape position
         
@@ -257,12 +280,15 @@ class TestPawn(unittest.TestCase):
         mock_board = Mock()
         
         # Pawn with valid moves is not blocked
-        mock_board.get_valid_moves_from_position.return_value = [(1, 2), (3, 2)]
+        mock_board.version = 0
+        self._stub_valid_moves(mock_board, [(1, 2), (3, 2)])
         self.pawn.set_position(2, 2)
         self.assertFalse(self.pawn.is_blocked(mock_board))
         
-        # Pawn with no valid moves is blocked
-        mock_board.get_valid_moves_from_position.return_value = []
+        # Pawn with no valid moves is blocked; the board changed, so its
+        # version moves on
+        mock_board.version = 1
+        self._stub_valid_moves(mock_board, [])
         self.assertTrue(self.pawn.is_blocked(mock_board))
     
     def test_is_adjacent_to(self):
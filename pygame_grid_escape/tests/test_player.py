@@ -6,8 +6,11 @@ import sys
 import os
 from unittest.mock import Mock
 
-# Add the parent directory to the path so we can import the game modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add the parent directory to the path so we can import the game modules;
+# every test module does this, so it is only added the first time
+PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PARENT_DIR not in sys.path:
+    sys.path.insert(0, PARENT_DIR)
 
 from game_logic.player import Player
 
@@ -79,6 +82,7 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(len(escaped), 2)
         self.assertIn(pawns[0], escaped)
         self.assertIn(pawns[1], escaped)
+        self.assertEqual(self.player.escaped_pawn_count, 2)
         
         # Should not be on board
         on_board = self.player.get_pawns_on_board()
@@ -88,6 +92,18 @@ class TestPlayer(unittest.TestCase):
         unplaced = self.player.get_unplaced_pawns()
         self.assertEqual(len(unplaced), 5)
     
+    def test_escaped_pawn_returned_to_board(self):
+        """Test that an escaped pawn put back on the board is tracked as on board."""
+        pawns = self.player.get_pawns()
+        pawns[0].set_position(0, 0)
+        pawns[0].escape()
+        pawns[0].set_position(1, 1)
+        
+        self.assertEqual(self.player.get_pawns_on_board(), [pawns[0]])
+        self.assertEqual(len(self.player.get_escaped_pawns()), 0)
+        self.assertEqual(self.player.escaped_pawn_count, 0)
+        self.assertEqual(self.player.get_unplaced_pawns(), list(pawns[1:]))
+    
     def test_has_won_false_initially(self):
         """Test that player hasn't won initially."""
         self.assertFalse(self.player.has_won())
@@ -114,6 +130,28 @@ class TestPlayer(unittest.TestCase):
         
         self.assertTrue(self.player.has_won())
     
+    def test_escaping_twice_counts_once(self):
+        """Test that escaping an already escaped pawn does not count it again."""
+        pawn = self.player.get_pawns()[0]
+        pawn.set_position(0, 0)
+        pawn.escape()
+        pawn.escape()
+        
+        self.assertEqual(len(self.player.get_escaped_pawns()), 1)
+    
+    def test_reset_pawns_clears_escaped_pawns(self):
+        """Test that resetting pawns clears escaped and on-board state."""
+        pawns = self.player.get_pawns()
+        for i in range(7):
+            pawns[i].set_position(i % 5, 0)
+            pawns[i].escape()
+        
+        self.player.reset_pawns()
+        
+        self.assertFalse(self.player.has_won())
+        self.assertEqual(len(self.player.get_escaped_pawns()), 0)
+        self.assertEqual(len(self.player.get_unplaced_pawns()), 7)
+    
     def test_can_move_any_pawn_false_when_no_pawns_on_board(self):
         """Test that can_move_any_pawn returns False when no pawns on board."""
         mock_board = Mock()
@@ -175,6 +213,22 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(self.player.get_pawn_at_position(1, 1), pawns[1])
         self.assertEqual(self.player.get_pawn_at_position(2, 2), pawns[2])
         self.assertIsNone(self.player.get_pawn_at_position(3, 3))
+    
+    def test_get_pawn_at_position_follows_moves_and_escapes(self):
+        """Test that position lookup tracks pawns as they move and escape."""
+        pawn = self.player.get_pawns()[0]
+        pawn.set_position(2, 2)
+        pawn.set_position(2, 1)
+        
+        self.assertIsNone(self.player.get_pawn_at_position(2, 2))
+        self.assertEqual(self.player.get_pawn_at_position(2, 1), pawn)
+        
+        pawn.escape()
+        self.assertIsNone(self.player.get_pawn_at_position(2, 1))
+        
+        # Off-board coordinates never match a pawn
+        pawn.set_position(0, 0)
+        self.assertIsNone(self.player.get_pawn_at_position(-1, 9))
 
 
 if __name__ == '__main__':